@@ -0,0 +1,29 @@
+"""
+Algorithm notes and reusable implementations.
+
+Subpackages are loaded on first attribute access (PEP 562 module __getattr__), so
+`import algorithms` costs next to nothing.
+
+Modules are meant to be run from src/ with -m, e.g.:
+    python -m algorithms.arrays.merge_arrays_1
+and any of them can be profiled on real input files (see __main__.py):
+    python -m algorithms profile merge_arrays a.i64 b.i64
+"""
+
+import importlib
+
+_SUBPACKAGES = ("arrays",)
+
+__all__ = list(_SUBPACKAGES)
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module  # cache: later lookups don't come back here
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
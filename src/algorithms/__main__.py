@@ -0,0 +1,307 @@
+"""
+Run any algorithm from algorithms.arrays on real data, with profiling.
+
+Run from src/:
+    python -m algorithms list
+    python -m algorithms profile <algorithm> <input-file>... [--k K] [--out DIR]
+
+Inputs
+------
+Each input file is one array (merges and intersections take two or three files):
+    *.i64 / *.bin   raw little-endian int64 values, memory-mapped: the algorithm reads
+                    straight from the page cache through a memoryview, nothing is parsed
+    *.f64           raw float64 values, memory-mapped the same way
+    anything else   text, whitespace-separated numbers in any layout, read in 1 MiB
+                    chunks into an array('q') (array('d') with --dtype float), so a big
+                    file never has to fit in memory as one str
+Algorithms that take a number as well (window size, target sum) get it from --k.
+
+What gets measured
+------------------
+The algorithm is run several times, each with one instrument, so they don't distort
+each other:
+    wall time      --repeat plain runs, perf_counter; best and all runs are reported
+    memory         one run under tracemalloc: peak bytes and the top allocation sites.
+                   tracemalloc hooks every allocation, and reading ints out of an array
+                   or memoryview allocates one per access, so this run can be 10-50x
+                   slower than the plain one. --no-memory skips it.
+    cProfile       one run; the top functions go into the summary, the raw stats into
+                   <algorithm>.prof (for pstats / snakeviz)
+    stacks         one run under sys.setprofile, which records the time spent in every
+                   distinct call stack; written as <algorithm>.collapsed in the
+                   "frame;frame;frame microseconds" format that flamegraph.pl and
+                   speedscope read. Tracing every call is slow (often 5-20x), so the
+                   absolute numbers are inflated — compare proportions, not seconds.
+                   --no-stacks skips it.
+Lazy results (window_max returns a generator) are drained inside every measurement, so
+the work is actually done where it's being measured. parallel_merge does its work in
+worker processes, which none of the profilers follow.
+Everything ends up in <algorithm>.json next to the other files.
+"""
+
+import argparse
+import cProfile
+from collections.abc import Iterator
+import importlib
+import json
+import mmap
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from array import array
+
+# name → (number of input arrays, where --k goes: None, "first" or "last");
+# arrays == 0 means "one or more". Modules come from algorithms.arrays._EXPORTS.
+_ALGORITHMS = {
+    "merge_arrays": (2, None),
+    "intersect": (2, None),
+    "intersect_with_skipping": (2, None),
+    "union": (2, None),
+    "difference": (2, None),
+    "symmetric_difference": (2, None),
+    "union_many": (0, None),
+    "difference_many": (0, None),
+    "intersect_three": (3, None),
+    "parallel_merge": (2, None),
+    "isValidSubsequence1": (2, None),
+    "isValidSubsequence2": (2, None),
+    "lcs_length": (2, None),
+    "minSubArrayLen": (1, "first"),
+    "minSubArray": (1, "first"),
+    "shortest_subarray_at_least_k": (1, "last"),
+    "count_subarrays_sum_exactly": (1, "last"),
+    "count_subarrays_sum_at_least": (1, "last"),
+    "window_max": (1, "last"),
+    "window_min": (1, "last"),
+    "windowed_extrema": (1, "last"),
+}
+
+_CHUNK = 1 << 20
+_MAPPED = {".i64": "q", ".bin": "q", ".f64": "d"}
+
+
+def _resolve(name):
+    from .arrays import _EXPORTS
+
+    return getattr(importlib.import_module(f"algorithms.arrays.{_EXPORTS[name]}"), name)
+
+
+def load_mapped(path, typecode):
+    """Memory-map a raw int64 / float64 file; returns (memoryview, mmap) — close both when done."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(array(typecode)), None  # mmap can't map an empty file
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) % 8:
+        mapped.close()
+        raise ValueError(f"{path}: size is not a multiple of 8 bytes")
+    return memoryview(mapped).cast(typecode), mapped
+
+
+def load_text(path, typecode="q"):
+    """Read whitespace-separated numbers in fixed-size chunks into an array."""
+    convert = int if typecode == "q" else float
+    values = array(typecode)
+    tail = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            chunk = tail + chunk
+            # the last token may continue in the next chunk: keep it back
+            cut = max(chunk.rfind(b" "), chunk.rfind(b"\n"), chunk.rfind(b"\t"), chunk.rfind(b"\r"))
+            if cut < 0:
+                tail = chunk
+                continue
+            values.extend(map(convert, chunk[:cut].split()))
+            tail = chunk[cut + 1 :]
+    values.extend(map(convert, tail.split()))
+    return values
+
+
+def _call(fn, arrays, k, k_position, hook=None):
+    """fn on the inputs, with k in its place; hook is installed as sys.setprofile around it."""
+    args = list(arrays)
+    if k_position == "first":
+        args.insert(0, k)
+    elif k_position == "last":
+        args.append(k)
+    if hook is not None:
+        sys.setprofile(hook)
+    try:
+        result = fn(*args)
+        if isinstance(result, Iterator):
+            result = list(result)
+    finally:
+        if hook is not None:
+            sys.setprofile(None)
+    return result
+
+
+def _describe(result):
+    if isinstance(result, (int, float, bool)) or result is None:
+        return result
+    try:
+        return {"type": type(result).__name__, "len": len(result)}
+    except TypeError:
+        return {"type": type(result).__name__}
+
+
+class _StackRecorder:
+    """sys.setprofile hook: microseconds of self time per distinct call stack."""
+
+    def __init__(self):
+        self.totals = {}
+        self._paths = []  # path of every open frame, "outer;...;inner"
+        self._last = 0
+
+    def __call__(self, frame, event, arg):
+        now = time.perf_counter_ns()
+        paths = self._paths
+        if paths:
+            path = paths[-1]
+            self.totals[path] = self.totals.get(path, 0) + (now - self._last)
+        if event == "call" or event == "c_call":
+            if event == "call":
+                code = frame.f_code
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            else:
+                label = getattr(arg, "__qualname__", repr(arg))
+            paths.append(f"{paths[-1]};{label}" if paths else label)
+        elif paths:  # return, c_return, c_exception
+            paths.pop()
+        self._last = time.perf_counter_ns()  # the hook's own time isn't charged to anyone
+
+    def write(self, path):
+        with open(path, "w") as out:
+            for stack, ns in sorted(self.totals.items()):
+                if ns >= 1000:
+                    out.write(f"{stack} {ns // 1000}\n")
+
+
+def profile(name, paths, k=None, dtype="int", repeat=3, out_dir=None, memory=True, stacks=True):
+    """Load the inputs, run algorithm `name` under every instrument and write the reports."""
+    arrays_needed, k_position = _ALGORITHMS[name]
+    if arrays_needed and len(paths) != arrays_needed:
+        raise SystemExit(f"{name} takes {arrays_needed} input file(s), got {len(paths)}")
+    if k_position is not None and k is None:
+        raise SystemExit(f"{name} needs --k")
+    fn = _resolve(name)
+    out_dir = out_dir or f"profile-{name}"
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, name)
+
+    arrays, maps, inputs = [], [], []
+    for path in paths:
+        start = time.perf_counter()
+        typecode = _MAPPED.get(os.path.splitext(path)[1])
+        if typecode is not None:
+            values, mapped = load_mapped(path, typecode)
+            maps.append((values, mapped))
+            how = "mmap"
+        else:
+            values = load_text(path, "d" if dtype == "float" else "q")
+            how = "text"
+        arrays.append(values)
+        inputs.append({"path": path, "loader": how, "length": len(values), "load_seconds": time.perf_counter() - start})
+
+    def run():
+        return _call(fn, arrays, k, k_position)
+
+    try:
+        runs = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            result = run()
+            runs.append(time.perf_counter() - start)
+        described = _describe(result)
+        del result  # it may hold views into the mapped inputs, which are closed below
+
+        peak = allocations = None
+        if memory:
+            tracemalloc.start()  # one frame per allocation: enough for by-line statistics
+            kept = run()  # alive for the snapshot, so it shows where the result was built
+            peak = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            del kept
+            allocations = [
+                {"site": str(stat.traceback[0]), "bytes": stat.size, "blocks": stat.count}
+                for stat in snapshot.statistics("lineno")[:10]
+            ]
+
+        profiler = cProfile.Profile()
+        profiler.runcall(run)
+        profiler.dump_stats(f"{base}.prof")
+        stats = pstats.Stats(profiler)
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:20]
+        functions = [
+            {"function": fn_name, "file": file, "line": line, "ncalls": nc, "tottime": tt, "cumtime": ct}
+            for (file, line, fn_name), (_cc, nc, tt, ct, _callers) in top
+        ]
+
+        collapsed = None
+        if stacks:
+            recorder = _StackRecorder()
+            _call(fn, arrays, k, k_position, hook=recorder)
+            collapsed = f"{base}.collapsed"
+            recorder.write(collapsed)
+    finally:
+        arrays.clear()
+        for values, mapped in maps:
+            values.release()
+            if mapped is not None:
+                mapped.close()
+
+    summary = {
+        "algorithm": name,
+        "inputs": inputs,
+        "k": k,
+        "result": described,
+        "wall_seconds": {"best": min(runs), "runs": runs},
+        "memory": {"peak_bytes": peak, "top_allocations": allocations},
+        "cprofile": {"stats_file": f"{base}.prof", "top_cumulative": functions},
+        "collapsed_stacks": collapsed,
+    }
+    with open(f"{base}.json", "w") as out:
+        json.dump(summary, out, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m algorithms", description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the algorithms that can be profiled")
+    run = commands.add_parser("profile", help="run one algorithm on input files, with profiling")
+    run.add_argument("algorithm", choices=sorted(_ALGORITHMS), metavar="algorithm")
+    run.add_argument("inputs", nargs="+", metavar="input-file")
+    run.add_argument("--k", type=float, help="the window size / target sum, for algorithms that take one")
+    run.add_argument("--dtype", choices=("int", "float"), default="int", help="how to parse text inputs")
+    run.add_argument("--repeat", type=int, default=3, help="timed runs; the fastest is reported as best")
+    run.add_argument("--out", help="output directory (default: profile-<algorithm>)")
+    run.add_argument("--no-memory", action="store_true", help="skip the (slow) tracemalloc run")
+    run.add_argument("--no-stacks", action="store_true", help="skip the (slow) collapsed-stack run")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, (arrays, k_position) in sorted(_ALGORITHMS.items()):
+            shape = "1+ arrays" if arrays == 0 else f"{arrays} array{'s' * (arrays > 1)}"
+            print(f"{name:<32} {shape}{' + --k' if k_position else ''}")
+        return 0
+    k = args.k
+    if k is not None and k.is_integer():
+        k = int(k)
+    summary = profile(
+        args.algorithm, args.inputs, k, args.dtype, args.repeat, args.out, not args.no_memory, not args.no_stacks
+    )
+    peak = summary["memory"]["peak_bytes"]
+    print(
+        f"{args.algorithm}: best {summary['wall_seconds']['best']:.4f}s, "
+        f"peak {'-' if peak is None else f'{peak / 1024:.0f} KiB'}, result {summary['result']}"
+    )
+    print(f"reports in {args.out or f'profile-{args.algorithm}'}/")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
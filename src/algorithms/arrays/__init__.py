@@ -0,0 +1,78 @@
+"""
+Array algorithms: merging, set operations on sorted arrays, posting lists, subarray sums,
+subsequences.
+
+Every public name below is importable from this package directly, but its module is only
+imported the first time the name is looked up:
+    from algorithms.arrays import intersect_three   # imports merge_arrays_2 only
+"""
+
+import importlib
+
+# public name → submodule that defines it
+_EXPORTS = {
+    "merge_arrays": "merge_arrays_1",
+    "intersect": "merge_arrays_1",
+    "intersect_with_skipping": "merge_arrays_1",
+    "iter_union": "merge_arrays_1",
+    "iter_difference": "merge_arrays_1",
+    "iter_symmetric_difference": "merge_arrays_1",
+    "union": "merge_arrays_1",
+    "difference": "merge_arrays_1",
+    "symmetric_difference": "merge_arrays_1",
+    "iter_union_many": "merge_arrays_1",
+    "iter_difference_many": "merge_arrays_1",
+    "union_many": "merge_arrays_1",
+    "difference_many": "merge_arrays_1",
+    "intersect_three": "merge_arrays_2",
+    "write_index": "posting_index",
+    "PostingIndex": "posting_index",
+    "intersect_with_skip_pointers": "posting_index",
+    "IntersectionCache": "query_cache",
+    "CacheStats": "query_cache",
+    "QueryServer": "query_service",
+    "QueryClient": "query_service",
+    "QueryError": "query_service",
+    "merge_permutation": "record_merge",
+    "merge_records": "record_merge",
+    "MergedRecords": "record_merge",
+    "co_rank": "parallel_merge",
+    "merge_partitions": "parallel_merge",
+    "parallel_merge": "parallel_merge",
+    "MonotonicDeque": "monotonic_deque",
+    "window_max": "monotonic_deque",
+    "window_min": "monotonic_deque",
+    "windowed_extrema": "monotonic_deque",
+    "window_max_np": "monotonic_deque",
+    "window_min_np": "monotonic_deque",
+    "FenwickTree": "prefix_sums",
+    "PrefixSumIndex": "prefix_sums",
+    "shortest_subarray_at_least_k": "min_subarray_with_negatives",
+    "count_subarrays_sum_exactly": "subarray_count",
+    "count_subarrays_sum_at_least": "subarray_count",
+    "SubarraySumCounter": "subarray_count",
+    "minSubArrayLen": "smallest_subarray_1",
+    "minSubArray": "smallest_subarray_1",
+    "min_subarray_len_2d": "subarray_batch",
+    "shortest_subarray_at_least_k_2d": "subarray_batch",
+    "isValidSubsequence1": "valid_subsequence_a2",
+    "isValidSubsequence2": "valid_subsequence_a2",
+    "SubsequenceScorer": "subsequence_lcs",
+    "lcs_length": "subsequence_lcs",
+    "lcs_lengths": "subsequence_lcs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache: later lookups don't come back here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
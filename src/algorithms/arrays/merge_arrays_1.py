@@ -29,6 +29,7 @@
 #      Stability:
 #         If A[a_idx] == B[b_idx], either order is acceptable
 #         (If we wanted stability across arrays, we’d specify it — but we didn’t)
+#         (merge_records in record_merge.py does specify it: ties="a" / "b")
 #     6️⃣ Failure conditions
 #         None, given the assumptions above
 #         This is a total function:
@@ -74,10 +75,11 @@ def merge_arrays(A, B):
     return c
 
 
-print(merge_arrays([1, 3, 5, 7, 9], [2, 4, 6, 8, 10, 12, 14]))
-print(merge_arrays([], [2, 4, 6, 8, 10, 12, 14]))
-print(merge_arrays([1, 3, 5, 7, 9], []))
-print(merge_arrays([], []))
+if __name__ == "__main__":
+    print(merge_arrays([1, 3, 5, 7, 9], [2, 4, 6, 8, 10, 12, 14]))
+    print(merge_arrays([], [2, 4, 6, 8, 10, 12, 14]))
+    print(merge_arrays([1, 3, 5, 7, 9], []))
+    print(merge_arrays([], []))
 
 # Problem — read carefully
 # Intersection of Two Sorted Arrays (Invariant-first)
@@ -128,11 +130,12 @@ def intersect(A, B):
     return c
 
 
-print(intersect([1, 3, 3, 5, 5, 7, 9], [1, 3, 5, 7, 9]))
-print(intersect([5, 5, 9], [1, 3, 5, 7, 9]))
-print(intersect([1, 3, 5, 7, 9], [9]))
-print(intersect([], [9]))
-print(intersect([], []))
+if __name__ == "__main__":
+    print(intersect([1, 3, 3, 5, 5, 7, 9], [1, 3, 5, 7, 9]))
+    print(intersect([5, 5, 9], [1, 3, 5, 7, 9]))
+    print(intersect([1, 3, 5, 7, 9], [9]))
+    print(intersect([], [9]))
+    print(intersect([], []))
 
 # The Next Level: "Skipping" at the Source
 # There is one tiny refactor that separates a "good" solution from a "robust" one. Instead of checking c[-1] every time, some engineers prefer to "drain" duplicates from the source arrays using a nested while loop or by jumping the pointers.
@@ -178,3 +181,184 @@ def intersect_with_skipping(A, B):
 # Clarity               Very Pythonic and concise.              More "Low-level" and explicit.
 # Separation            Logic is mixed (matching + checking).   Logic is separate (matching, then advancing).
 # Edge Cases            Relies on c not being empty.            Relies only on array boundaries.
+
+
+# Set algebra siblings: union, difference, symmetric difference
+# The same skip logic gives us the rest of the set operations on sorted arrays,
+# without round-tripping through set() (which loses sortedness and needs extra memory).
+
+# Shared invariant (two arrays):
+#   At the start of each iteration, a_idx and b_idx point to the first occurrence of a
+#   value in A and B that hasn't been processed yet, and every value smaller than
+#   min(A[a_idx], B[b_idx]) has already been emitted (or rejected) exactly once.
+# Movement rule:
+#   Whichever side holds the smaller value owns it — decide, emit or drop, then drain
+#   its duplicates. On a tie both sides own it, so both drain.
+# Completion:
+#   When one array is exhausted the remaining tail of the other is decided by the
+#   operation alone (union / symmetric difference keep it, difference keeps A's tail).
+#   The tail still has to be drained of duplicates.
+
+# Each operation is written as a generator (iter_*) so large inputs can be streamed
+# lazily; the list-returning versions are thin wrappers around them.
+
+
+def _iter_unique_from(A, a_idx):
+    """Yield the distinct values of sorted A starting at a_idx."""
+    while a_idx < len(A):
+        current_val = A[a_idx]
+        yield current_val
+        while a_idx < len(A) and A[a_idx] == current_val:
+            a_idx += 1
+
+
+def iter_union(A, B):
+    """
+    Lazily yield the unique elements of A ∪ B in increasing order.
+
+    Args:
+        A : an array sorted in non decreasing order
+        B : an array sorted in non decreasing order
+    """
+    a_idx = 0
+    b_idx = 0
+    while a_idx < len(A) and b_idx < len(B):
+        current_val = A[a_idx] if A[a_idx] <= B[b_idx] else B[b_idx]
+        yield current_val
+        while a_idx < len(A) and A[a_idx] == current_val:
+            a_idx += 1
+        while b_idx < len(B) and B[b_idx] == current_val:
+            b_idx += 1
+    yield from _iter_unique_from(A, a_idx)
+    yield from _iter_unique_from(B, b_idx)
+
+
+def iter_difference(A, B):
+    """
+    Lazily yield the unique elements of A − B in increasing order.
+
+    Args:
+        A : an array sorted in non decreasing order
+        B : an array sorted in non decreasing order
+    """
+    a_idx = 0
+    b_idx = 0
+    while a_idx < len(A) and b_idx < len(B):
+        if A[a_idx] > B[b_idx]:
+            b_idx += 1
+            continue
+        current_val = A[a_idx]
+        if current_val < B[b_idx]:
+            yield current_val
+        while a_idx < len(A) and A[a_idx] == current_val:
+            a_idx += 1
+    yield from _iter_unique_from(A, a_idx)
+
+
+def iter_symmetric_difference(A, B):
+    """
+    Lazily yield the unique elements found in exactly one of A and B, in increasing order.
+
+    Args:
+        A : an array sorted in non decreasing order
+        B : an array sorted in non decreasing order
+    """
+    a_idx = 0
+    b_idx = 0
+    while a_idx < len(A) and b_idx < len(B):
+        current_val = A[a_idx] if A[a_idx] <= B[b_idx] else B[b_idx]
+        if A[a_idx] != B[b_idx]:
+            yield current_val
+        while a_idx < len(A) and A[a_idx] == current_val:
+            a_idx += 1
+        while b_idx < len(B) and B[b_idx] == current_val:
+            b_idx += 1
+    yield from _iter_unique_from(A, a_idx)
+    yield from _iter_unique_from(B, b_idx)
+
+
+def union(A, B):
+    """Return a new array with the unique elements of A ∪ B in increasing order."""
+    return list(iter_union(A, B))
+
+
+def difference(A, B):
+    """Return a new array with the unique elements of A − B in increasing order."""
+    return list(iter_difference(A, B))
+
+
+def symmetric_difference(A, B):
+    """Return a new array with the unique elements in exactly one of A and B, in increasing order."""
+    return list(iter_symmetric_difference(A, B))
+
+
+if __name__ == "__main__":
+    print(union([1, 3, 3, 5, 7], [2, 3, 4, 4, 8]))
+    print(difference([1, 3, 3, 5, 7], [2, 3, 4, 4, 8]))
+    print(symmetric_difference([1, 3, 3, 5, 7], [2, 3, 4, 4, 8]))
+    print(union([], [2, 2]), difference([1, 1], []), symmetric_difference([], []))
+
+
+# N-way variants
+# Union of k arrays: the "move the minimum" rule from intersect_three generalises, but
+# picking the minimum out of k heads costs O(k) per step. A heap keeps that at O(log k),
+# so the total is O(N log k) for N elements overall. heapq.merge already maintains the
+# invariant "everything yielded so far is <= every head still in the heap"; we only have
+# to drop duplicates on the way out.
+# Difference A − (B1 ∪ B2 ∪ ... ∪ Bk): walk A's distinct values once, and for each one
+# advance every B pointer past the smaller values (pointers never move backwards, so the
+# B side is O(total length) in aggregate).
+# Invariant: every B pointer points to the first value >= the current candidate from A.
+from heapq import merge as _heap_merge
+
+
+def iter_union_many(*arrays):
+    """
+    Lazily yield the unique elements of the union of all arrays in increasing order.
+
+    Args:
+        arrays : any number of arrays, each sorted in non decreasing order
+    """
+    first = True
+    for val in _heap_merge(*arrays):
+        if first or val != current_val:
+            current_val = val
+            first = False
+            yield current_val
+
+
+def iter_difference_many(A, *others):
+    """
+    Lazily yield the unique elements of A that appear in none of the other arrays.
+
+    Args:
+        A : an array sorted in non decreasing order
+        others : arrays sorted in non decreasing order to subtract from A
+    """
+    idxs = [0] * len(others)
+    for current_val in _iter_unique_from(A, 0):
+        keep = True
+        for k, B in enumerate(others):
+            b_idx = idxs[k]
+            while b_idx < len(B) and B[b_idx] < current_val:
+                b_idx += 1
+            idxs[k] = b_idx
+            if b_idx < len(B) and B[b_idx] == current_val:
+                keep = False
+        if keep:
+            yield current_val
+
+
+def union_many(*arrays):
+    """Return a new array with the unique elements of the union of all arrays."""
+    return list(iter_union_many(*arrays))
+
+
+def difference_many(A, *others):
+    """Return a new array with the unique elements of A that appear in none of the others."""
+    return list(iter_difference_many(A, *others))
+
+
+if __name__ == "__main__":
+    print(union_many([1, 4, 4, 9], [2, 4, 6], [], [0, 9, 9]))
+    print(difference_many([1, 2, 3, 4, 5, 6, 6, 7], [2, 4], [6], [7, 8]))
@@ -26,40 +26,44 @@ Explanation:
     contiguous subarray with sum >= k.
 """
 
-from typing import List
-from collections import deque
+from typing import List, Union
+from .monotonic_deque import MonotonicDeque
+from .prefix_sums import PrefixSumIndex
 
 
-def shortest_subarray_at_least_k(nums: List[int], k: int) -> int:
+def shortest_subarray_at_least_k(nums: Union[List[int], PrefixSumIndex], k: int) -> int:
     """
     Returns the length of the shortest non-empty subarray
     with sum >= k. If no such subarray exists, return -1.
+
+    nums may also be a PrefixSumIndex, in which case its prefix sums are reused
+    instead of being recomputed for this call.
     """
     # Initialize prefix sums array
     # Future optimization if space is a constraint - we need prefix sums only for the candidate starts so we can populate it on the go and keep it aligned with starts deque.
-    P = [0] * (len(nums) + 1)
-    for i in range(len(nums)):
-        P[i + 1] = P[i] + nums[i]
+    if not isinstance(nums, PrefixSumIndex):
+        nums = PrefixSumIndex(nums)
+    P = nums.prefix
     # Initialize deque and cached results
-    starts = deque()
+    # Increasing deque: pushing j pops every back start with P >= P[j] (back pruning)
+    starts = MonotonicDeque(increasing=True)
     best_len = float("inf")
     # best_window = [] # left and right indices
     for j in range(len(P)):
-        while starts and P[j] - P[starts[0]] >= k:
-            best_len = min(best_len, j - starts.popleft())
-            # left = starts.popleft()
+        while starts and P[j] - starts.front_value() >= k:
+            best_len = min(best_len, j - starts.pop_front())
+            # left = starts.pop_front()
             # window_len = j - left
             # if window_len < best_len:
             #     best_len = window_len
             #     best_window = [left, j]
-        while starts and P[j] <= P[starts[-1]]:
-            starts.pop()
-        starts.append(j)
+        starts.push(j, P[j])
     # return nums[best_window[0]:best_window[1]] # No +1 correction needed. These are prefix sum indices.
     return -1 if best_len == float("inf") else best_len
 
 
-print(shortest_subarray_at_least_k([2, 4, -3, 4, 2, 6, 1, 2], 6))
+if __name__ == "__main__":
+    print(shortest_subarray_at_least_k([2, 4, -3, 4, 2, 6, 1, 2], 6))
 """
 Why Sliding Window Fails
 -----------------------
@@ -0,0 +1,186 @@
+"""
+Monotonic Deque Toolkit
+
+The deque in shortest_subarray_at_least_k (min_subarray_with_negatives.py) is an instance
+of a more general structure: a deque of (index, value) pairs whose values are kept
+monotonic by dominance pruning at the back, and which is consumed or expired from the
+front. The same machinery answers sliding-window maximum / minimum queries.
+
+Dominance (the only rule the structure enforces):
+- increasing deque (front = minimum): a newer value v dominates every older value >= v.
+  The older one can never again be the minimum of a window that contains the newer one.
+- decreasing deque (front = maximum): a newer value v dominates every older value <= v.
+
+Front pruning is left to the caller, because what "exhausted" means depends on the
+problem: an index that fell out of a sliding window (expire), or a start index whose best
+subarray has already been recorded (pop_front).
+
+Complexity: every index is pushed once and popped at most once, so any sequence of n
+operations is O(n) total — O(1) amortized per element.
+"""
+
+from collections import deque
+from operator import ge, le
+
+
+class MonotonicDeque:
+    """
+    Deque of (index, value) pairs with monotonic values, front to back.
+
+    Args:
+        increasing : True keeps values strictly increasing (front is the minimum),
+            False keeps them strictly decreasing (front is the maximum)
+    """
+
+    __slots__ = ("_indices", "_values", "_dominated")
+
+    def __init__(self, increasing: bool = True):
+        self._indices = deque()
+        self._values = deque()
+        # _dominated(back, new) is True when `back` can be discarded in favour of `new`
+        self._dominated = ge if increasing else le
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __bool__(self) -> bool:
+        return bool(self._indices)
+
+    def __repr__(self) -> str:
+        pairs = list(zip(self._indices, self._values))
+        return f"MonotonicDeque({pairs!r})"
+
+    def push(self, index, value) -> None:
+        """Append (index, value), first popping every entry at the back it dominates."""
+        values = self._values
+        dominated = self._dominated
+        while values and dominated(values[-1], value):
+            values.pop()
+            self._indices.pop()
+        values.append(value)
+        self._indices.append(index)
+
+    def front_index(self):
+        return self._indices[0]
+
+    def front_value(self):
+        """The extremum (minimum or maximum) of everything currently held."""
+        return self._values[0]
+
+    def pop_front(self):
+        """Remove the front entry and return its index."""
+        self._values.popleft()
+        return self._indices.popleft()
+
+    def expire(self, before) -> None:
+        """Drop front entries whose index is < before (they left the window)."""
+        indices = self._indices
+        while indices and indices[0] < before:
+            indices.popleft()
+            self._values.popleft()
+
+
+def _check_window(k):
+    # called from the plain functions, not from inside the generators: a generator body
+    # only starts on the first next(), so a bad k would surface far from the call
+    if k < 1:
+        raise ValueError("window size k must be >= 1")
+
+
+def _window_extremum(iterable, k, increasing):
+    dq = MonotonicDeque(increasing)
+    push, expire, front_value = dq.push, dq.expire, dq.front_value
+    for i, value in enumerate(iterable):
+        push(i, value)
+        if i >= k - 1:
+            expire(i - k + 1)
+            yield front_value()
+
+
+def window_max(iterable, k):
+    """
+    Lazily yield the maximum of every window of k consecutive values.
+
+    The first result is produced once k values have been seen; a stream of n values
+    yields n - k + 1 results.
+    """
+    _check_window(k)
+    return _window_extremum(iterable, k, increasing=False)
+
+
+def window_min(iterable, k):
+    """Lazily yield the minimum of every window of k consecutive values."""
+    _check_window(k)
+    return _window_extremum(iterable, k, increasing=True)
+
+
+def windowed_extrema(iterable, k):
+    """Lazily yield (minimum, maximum) for every window of k consecutive values, in one pass."""
+    _check_window(k)
+    return _windowed_extrema(iterable, k)
+
+
+def _windowed_extrema(iterable, k):
+    lows = MonotonicDeque(increasing=True)
+    highs = MonotonicDeque(increasing=False)
+    for i, value in enumerate(iterable):
+        lows.push(i, value)
+        highs.push(i, value)
+        if i >= k - 1:
+            lows.expire(i - k + 1)
+            highs.expire(i - k + 1)
+            yield lows.front_value(), highs.front_value()
+
+
+"""
+Batch path for fixed windows (NumPy)
+------------------------------------
+A deque is inherently sequential. For a whole array at once we use the van Herk /
+Gil-Werman decomposition instead, which is O(n) and fully vectorized:
+
+Cut the array into blocks of k. Any window of length k starting at i covers the tail of
+one block and the head of the next, so
+    window_max[i] = max(suffix_max[i], prefix_max[i + k - 1])
+where prefix_max is the running max from the start of each block and suffix_max is the
+running max from the end of each block. Both are one ufunc.accumulate over a (blocks, k)
+reshape.
+"""
+
+
+def _window_extremum_np(values, k, ufunc_name):
+    # imported here rather than at module level: numpy is optional, and slow to import
+    import numpy as np
+
+    ufunc = getattr(np, ufunc_name)
+    a = np.asarray(values)
+    n = len(a)
+    if k < 1:
+        raise ValueError("window size k must be >= 1")
+    if n < k:
+        return a[:0].copy()
+    # Pad to a whole number of blocks. A window that fits inside the array never reads
+    # past the end of the array in either scan, so the padding value is irrelevant.
+    pad = -n % k
+    blocks = np.concatenate([a, np.repeat(a[-1:], pad)]).reshape(-1, k)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[: n - k + 1], prefix[k - 1 : n])
+
+
+def window_max_np(values, k):
+    """Return a NumPy array with the maximum of every window of k consecutive values."""
+    return _window_extremum_np(values, k, "maximum")
+
+
+def window_min_np(values, k):
+    """Return a NumPy array with the minimum of every window of k consecutive values."""
+    return _window_extremum_np(values, k, "minimum")
+
+
+if __name__ == "__main__":
+    data = [1, 3, -1, -3, 5, 3, 6, 7]
+    print(list(window_max(data, 3)))  # [3, 3, 5, 5, 6, 7]
+    print(list(window_min(data, 3)))  # [-1, -3, -3, -3, 3, 3]
+    print(list(windowed_extrema(data, 3)))
+    print(window_max_np(data, 3))
+    print(window_min_np(data, 3))
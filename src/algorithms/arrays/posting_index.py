@@ -0,0 +1,359 @@
+"""
+Problem: Posting lists on disk — intersect without loading
+
+intersect, intersect_with_skipping (merge_arrays_1.py) and intersect_three
+(merge_arrays_2.py) are exactly the posting-list operations of a search index: each term
+maps to the sorted ids of the documents containing it, and a query for several terms is
+the intersection of their lists. As plain Python lists, though, every process has to
+rebuild every list (read, parse, allocate) before it can answer anything.
+
+Here the whole index lives in one file that is memory-mapped read-only. A posting list
+is a memoryview cast to int64 straight over the mapped pages: no parsing, no copying,
+and the OS only reads the pages a query actually touches. The intersect functions only
+need len() and indexing, so they run on these views unchanged.
+
+Contract:
+- Document ids are integers that fit in a signed 64-bit integer.
+- Terms are str; they are stored as UTF-8 and looked up by binary search.
+- Posting lists are stored sorted and without duplicates.
+"""
+
+from array import array
+from bisect import bisect_left
+import mmap
+import struct
+import sys
+
+from .merge_arrays_1 import _iter_unique_from
+
+"""
+File layout
+-----------
+All integers are little-endian int64 unless noted; every section starts on an 8-byte
+boundary so it can be cast in place.
+
+    header          MAGIC (8 bytes), version (u32), skip interval (u32),
+                    term count T, then the byte offset of each section below
+    term_offsets    T + 1 entries: term i is term_blob[term_offsets[i]:term_offsets[i + 1]]
+    post_offsets    T + 1 entries: term i's postings are postings[post_offsets[i]:post_offsets[i + 1]]
+    skip_offsets    T + 1 entries: term i's skips are skips[skip_offsets[i]:skip_offsets[i + 1]]
+    term_blob       the terms, UTF-8, concatenated in sorted (byte) order
+    postings        every posting list, concatenated
+    skips           every skip list, concatenated
+
+Skip pointers
+-------------
+For a posting list P and skip interval s, the skip list holds P[0], P[s], P[2s], ...
+Entry j is an implicit pointer to position j * s. To advance P's cursor to the first
+value >= x, binary search the skip list for the last entry < x and jump straight to its
+block; only the rest of one block is then walked one step at a time. A long list
+intersected with a short one is read in O(short * (log(long / s) + s)) instead of
+O(long + short).
+
+What it costs
+-------------
+Indexing an int64 memoryview builds a fresh int object per access, where a list just
+hands out the one it already holds, so a full merge-style pass over views runs at about
+half the speed of the same pass over lists (bench_cold_start). The trade is still
+lopsided: the text version spends far longer parsing every list before its first
+answer than the views lose on a few hundred queries, and the skip pointers win back the
+per-access cost on lists of very different lengths. The file is larger than the text
+form for small ids (8 bytes per id instead of a few digits).
+"""
+
+MAGIC = b"POSTIDX\x00"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIqqqqqqq")
+# the file is little-endian, so only a little-endian machine can cast its int64 sections
+# in place
+_IN_PLACE = sys.byteorder == "little"
+
+
+def _pad8(n):
+    return -n % 8
+
+
+def write_index(path, postings, skip_interval: int = 64) -> None:
+    """
+    Write a posting-list index file.
+
+    Args:
+        path : file to create (overwritten if it exists)
+        postings : mapping of term → iterable of document ids (any order, duplicates ok)
+        skip_interval : distance between skip pointers, in postings
+    """
+    if skip_interval < 1:
+        raise ValueError("skip_interval must be >= 1")
+    encoded = sorted((term.encode("utf-8"), sorted(set(ids))) for term, ids in postings.items())
+    term_offsets = array("q", [0])
+    post_offsets = array("q", [0])
+    skip_offsets = array("q", [0])
+    term_blob = bytearray()
+    all_postings = array("q")
+    all_skips = array("q")
+    for term, ids in encoded:
+        term_blob += term
+        all_postings.extend(ids)
+        all_skips.extend(ids[::skip_interval])
+        term_offsets.append(len(term_blob))
+        post_offsets.append(len(all_postings))
+        skip_offsets.append(len(all_skips))
+    term_blob += bytes(_pad8(len(term_blob)))
+
+    sections = [term_offsets, post_offsets, skip_offsets, term_blob, all_postings, all_skips]
+    starts = []
+    position = _HEADER.size
+    for section in sections:
+        starts.append(position)
+        position += len(section) * (8 if isinstance(section, array) else 1)
+    if sys.byteorder != "little":
+        for section in sections:
+            if isinstance(section, array):
+                section.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, skip_interval, len(encoded), *starts))
+        for section in sections:
+            f.write(section)
+
+
+def _int64s(buf):
+    """buf's little-endian int64s: a view cast in place, or else a byteswapped array copy."""
+    if _IN_PLACE:
+        return buf.cast("q")
+    values = array("q")
+    values.frombytes(buf)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class _Terms:
+    """Sequence view of the sorted term blob, so that bisect can search it in place."""
+
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        # bytes, not a memoryview slice: memoryviews only support ==, and bisect needs <
+        return bytes(self._blob[self._offsets[i] : self._offsets[i + 1]])
+
+
+class PostingIndex:
+    """
+    Read-only, memory-mapped posting-list index written by write_index.
+
+    postings(term) and skips(term) return int64 memoryviews over the mapped file. They
+    keep the mapping alive: close() raises BufferError while any of them is still
+    referenced. On a big-endian machine the int64 sections can't be used in place: they
+    are read into byteswapped arrays when the index is opened, and postings(term) and
+    skips(term) are array slices (copies) instead.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.skip_interval, count, *starts = _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path!r} is not a version {VERSION} posting index")
+            buf = memoryview(self._mmap)
+            term_at, post_at, skip_at, blob_at, postings_at, skips_at = starts
+            self._term_offsets = _int64s(buf[term_at:post_at])
+            self._post_offsets = _int64s(buf[post_at:skip_at])
+            self._skip_offsets = _int64s(buf[skip_at:blob_at])
+            self._postings = _int64s(buf[postings_at:skips_at])
+            self._skips = _int64s(buf[skips_at:])
+            self._terms = _Terms(self._term_offsets, buf[blob_at:postings_at])
+            self._buf = buf
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        for view in (
+            self._term_offsets,
+            self._post_offsets,
+            self._skip_offsets,
+            self._postings,
+            self._skips,
+            self._terms._blob,
+            self._buf,
+        ):
+            if isinstance(view, memoryview):  # not the arrays of a big-endian machine
+                view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term) -> bool:
+        return self._find(term) is not None
+
+    def terms(self):
+        """Yield every term, in sorted (UTF-8 byte) order."""
+        terms = self._terms
+        for i in range(len(terms)):
+            yield terms[i].decode("utf-8")
+
+    def _find(self, term):
+        key = term.encode("utf-8")
+        i = bisect_left(self._terms, key)
+        if i < len(self._terms) and self._terms[i] == key:
+            return i
+        return None
+
+    def _slot(self, term):
+        i = self._find(term)
+        if i is None:
+            raise KeyError(term)
+        return i
+
+    def postings(self, term):
+        """The term's sorted document ids, as an int64 memoryview over the file (no copy)."""
+        i = self._slot(term)
+        return self._postings[self._post_offsets[i] : self._post_offsets[i + 1]]
+
+    def skips(self, term):
+        """The term's skip list: every skip_interval-th posting, as an int64 memoryview."""
+        i = self._slot(term)
+        return self._skips[self._skip_offsets[i] : self._skip_offsets[i + 1]]
+
+    def intersect(self, *terms):
+        """
+        Return the sorted ids of the documents containing every term.
+
+        The shortest list drives; each longer list is probed through its skip pointers.
+        A term that isn't in the index matches no documents.
+        """
+        if not terms:
+            raise TypeError("intersect() needs at least one term")
+        if not all(term in self for term in terms):
+            return []
+        lists = sorted(((self.postings(t), self.skips(t)) for t in terms), key=lambda ps: len(ps[0]))
+        result = lists[0][0]
+        for postings, skips in lists[1:]:
+            result = intersect_with_skip_pointers(result, postings, skips, self.skip_interval)
+            if not result:
+                break
+        return list(result)
+
+
+def intersect_with_skip_pointers(A, B, B_skips, interval):
+    """
+    Return the unique elements of A ∩ B in increasing order, skipping through B.
+
+    Args:
+        A : an array sorted in non decreasing order (the shorter one, ideally)
+        B : an array sorted in non decreasing order
+        B_skips : B[::interval]
+        interval : the skip interval B_skips was built with
+    """
+    b_idx = 0
+    c = []
+    # Invariant: c holds the unique common values smaller than the current candidate,
+    # and every value in B[0:b_idx] is smaller than the current candidate.
+    for current_val in _iter_unique_from(A, 0):
+        if b_idx < len(B) and B[b_idx] < current_val:
+            # last block whose first value is < current_val: everything before it is too
+            block = bisect_left(B_skips, current_val, b_idx // interval + 1) - 1
+            b_idx = max(b_idx, block * interval)
+            while b_idx < len(B) and B[b_idx] < current_val:
+                b_idx += 1
+        if b_idx == len(B):
+            break
+        if B[b_idx] == current_val:
+            c.append(current_val)
+    return c
+
+
+def bench_cold_start(terms=2000, docs=200_000, queries=200, skip_interval=64):
+    """
+    Cold start: parse a text posting file into lists, or open the mmap index; then query.
+
+    Both files are in the page cache after being written, so this measures the per-process
+    cost of getting to the first answer, not disk reads.
+    """
+    import os
+    import random
+    import tempfile
+    import time
+
+    from .merge_arrays_1 import intersect_with_skipping
+    from .merge_arrays_2 import intersect_three
+
+    rng = random.Random(0)
+    # Zipf-ish document frequencies: a few very common terms, many rare ones
+    postings = {f"term{t}": rng.sample(range(docs), max(1, docs // (t + 2))) for t in range(terms)}
+    pairs = [tuple(rng.sample(sorted(postings), 2)) for _ in range(queries)]
+    triples = [tuple(rng.sample(sorted(postings), 3)) for _ in range(queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "postings.txt")
+        index_path = os.path.join(tmp, "postings.idx")
+        with open(text_path, "w") as f:
+            for term, ids in postings.items():
+                f.write(f"{term} {' '.join(map(str, sorted(ids)))}\n")
+        write_index(index_path, postings, skip_interval)
+        print(f"text {os.path.getsize(text_path) >> 10} KiB, index {os.path.getsize(index_path) >> 10} KiB")
+
+        def timed(label, fn):
+            start = time.perf_counter()
+            result = fn()
+            print(f"{label:<44} {time.perf_counter() - start:7.3f}s")
+            return result
+
+        def load_text():
+            lists = {}
+            with open(text_path) as f:
+                for line in f:
+                    term, *ids = line.split()
+                    lists[term] = list(map(int, ids))
+            return lists
+
+        lists = timed("text: read + parse every list", load_text)
+        expected = timed(
+            "text: intersect_with_skipping, pairs",
+            lambda: [intersect_with_skipping(lists[a], lists[b]) for a, b in pairs],
+        )
+        timed("text: intersect_three, triples", lambda: [intersect_three(*(lists[t] for t in q)) for q in triples])
+
+        index = timed("mmap: open index", lambda: PostingIndex(index_path))
+        got = timed(
+            "mmap: intersect_with_skipping on views, pairs",
+            lambda: [intersect_with_skipping(index.postings(a), index.postings(b)) for a, b in pairs],
+        )
+        assert got == expected
+        timed(
+            "mmap: intersect_three on views, triples",
+            lambda: [intersect_three(*(index.postings(t) for t in q)) for q in triples],
+        )
+        assert timed("mmap: PostingIndex.intersect (skips), pairs", lambda: [index.intersect(*q) for q in pairs]) == expected
+        timed("mmap: PostingIndex.intersect (skips), triples", lambda: [index.intersect(*q) for q in triples])
+        index.close()
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "demo.idx")
+        write_index(path, {"cat": [1, 3, 5, 7, 9], "dog": [3, 4, 5, 9, 12], "owl": [5, 9, 11]}, skip_interval=2)
+        with PostingIndex(path) as index:
+            print(list(index.terms()), index.skip_interval)  # ['cat', 'dog', 'owl'] 2
+            print(index.postings("cat").tolist(), index.skips("cat").tolist())  # [1, 3, 5, 7, 9] [1, 5, 9]
+            print(index.intersect("cat", "dog"), index.intersect("cat", "dog", "owl"))  # [3, 5, 9] [5, 9]
+            print(index.intersect("cat", "emu"))  # []
+    bench_cold_start()
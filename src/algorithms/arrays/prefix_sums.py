@@ -0,0 +1,186 @@
+"""
+Prefix-Sum Index
+
+Let P be the prefix sum array of nums:
+    P[0] = 0
+    P[i] = nums[0] + nums[1] + ... + nums[i-1]
+
+Then sum(nums[i:j]) == P[j] - P[i] for any 0 <= i <= j <= len(nums): one subtraction,
+regardless of the window length. The subarray solvers (min_subarray_with_negatives.py)
+are built on exactly this identity, so the index is built once here and can be handed to
+them instead of recomputing P per call.
+
+Static vs dynamic workloads
+---------------------------
+A flat prefix array answers queries in O(1) but a point update costs O(n) (every later
+prefix changes). A Fenwick (binary indexed) tree trades that for O(log n) on both sides.
+PrefixSumIndex starts out flat and switches itself to a Fenwick tree on the first update,
+so read-only users never pay for the tree.
+"""
+
+from array import array
+from itertools import accumulate
+
+
+def _prefix_array(values):
+    """Return P as array('q'), or as a list if a sum does not fit in 64 bits."""
+    prefix = list(accumulate(values, initial=0))
+    try:
+        return array("q", prefix)
+    except (OverflowError, TypeError):
+        # big ints or floats: keep Python semantics rather than truncating
+        return prefix
+
+
+def _position(i, n):
+    """i as an item index of a length-n sequence, negative indices counted from the end."""
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError("index out of range")
+    return i
+
+
+def _bounds(i, j, n):
+    """(i, j) as slice bounds 0 <= i <= j <= n; unlike a slice, out-of-range bounds raise."""
+    if i < 0:
+        i += n
+    if j < 0:
+        j += n
+    if not (0 <= i <= n and 0 <= j <= n):
+        raise IndexError("range out of bounds")
+    if i > j:
+        raise ValueError(f"range_sum needs i <= j, got {i} > {j}")
+    return i, j
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over a fixed-length sequence of numbers.
+
+    Invariant: _tree[i] (1-based) holds the sum of the values in (i - lowbit(i), i],
+    where lowbit(i) = i & -i.
+    """
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, values=()):
+        tree = [0]
+        tree.extend(values)
+        # O(n) build: push each node's partial sum up to its parent once
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def add(self, i, delta) -> None:
+        """values[i] += delta, in O(log n)."""
+        tree = self._tree
+        # a raw i = -1 would become node 0, where i & -i == 0 never moves the loop on
+        i = _position(i, len(tree) - 1) + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i):
+        """Return sum(values[:i]) for 0 <= i <= len(self), in O(log n); i isn't checked."""
+        tree = self._tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, i, j):
+        """Return sum(values[i:j]), in O(log n)."""
+        i, j = _bounds(i, j, len(self))
+        return self.prefix_sum(j) - self.prefix_sum(i)
+
+
+class PrefixSumIndex:
+    """
+    Range-sum index over a sequence of numbers.
+
+    Args:
+        values : the numbers to index
+        backend : "array" stores P as array('q') (falling back to a list when the sums
+            do not fit in 64 bits), "numpy" stores it as an int64 / float64 ndarray
+    """
+
+    __slots__ = ("_values", "_prefix", "_fenwick", "_backend")
+
+    def __init__(self, values, backend: str = "array"):
+        if backend not in ("array", "numpy"):
+            raise ValueError(f"unknown backend {backend!r}")
+        self._values = list(values)
+        self._backend = backend
+        self._fenwick = None
+        self._prefix = self._build_prefix()
+
+    def _build_prefix(self):
+        if self._backend == "numpy":
+            # imported here rather than at module level: numpy is optional, and slow to import
+            import numpy as np
+
+            values = np.asarray(self._values) if self._values else np.zeros(0, np.int64)
+            prefix = np.zeros(len(values) + 1, dtype=np.result_type(values.dtype, np.int64))
+            np.cumsum(values, out=prefix[1:])
+            return prefix
+        return _prefix_array(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def prefix(self):
+        """
+        The prefix sum array P (len(self) + 1 entries, P[0] == 0).
+
+        After point updates this is rebuilt on access, in O(n).
+        """
+        if self._prefix is None:
+            self._prefix = self._build_prefix()
+        return self._prefix
+
+    def range_sum(self, i, j):
+        """
+        Return sum(values[i:j]).
+
+        O(1) while the index is static; O(log n) once it has switched to a Fenwick tree.
+        Negative bounds count from the end; i > j raises ValueError in both modes.
+        """
+        i, j = _bounds(i, j, len(self._values))
+        if self._fenwick is not None:
+            return self._fenwick.prefix_sum(j) - self._fenwick.prefix_sum(i)
+        P = self._prefix
+        return P[j] - P[i]
+
+    def add(self, i, delta) -> None:
+        """values[i] += delta. The first update switches the index to a Fenwick tree."""
+        i = _position(i, len(self._values))
+        if self._fenwick is None:
+            self._fenwick = FenwickTree(self._values)
+        self._fenwick.add(i, delta)
+        self._values[i] += delta
+        self._prefix = None
+
+    def __setitem__(self, i, value) -> None:
+        i = _position(i, len(self._values))
+        self.add(i, value - self._values[i])
+
+    def __getitem__(self, i):
+        # list indexing already counts negative i from the end and raises IndexError
+        return self._values[i]
+
+
+if __name__ == "__main__":
+    index = PrefixSumIndex([2, -1, 2, 1])
+    print(index.prefix)  # array('q', [0, 2, 1, 3, 4])
+    print(index.range_sum(2, 4))  # 3
+    index[1] = 5
+    print(index.range_sum(0, 2), index.range_sum(1, 4))  # 7 8
+    print(index.prefix)  # array('q', [0, 2, 7, 9, 10])
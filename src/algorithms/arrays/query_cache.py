@@ -0,0 +1,258 @@
+"""
+Problem: The same intersections, over and over
+
+A query mix that keeps asking for intersect(A, B) and intersect_three(A, B, C) over the
+same handful of lists recomputes the same two-pointer walks every time. IntersectionCache
+answers those queries (and unions) and remembers the results, with three rules:
+
+Keys
+----
+Lists are registered under stable ids, and each id carries a version counter that goes
+up whenever the list changes. A result is keyed by the operation and the *set* of
+(id, version) pairs it was computed from:
+    intersect("a", "b") and intersect("b", "a", "a") share one entry (∩ and ∪ are
+    commutative and idempotent)
+    after update("a", ...) the old key can never match again
+Entries built on an old version are also dropped eagerly, so they stop taking up space.
+
+Subset reuse
+------------
+A ∩ B ∩ C == (A ∩ B) ∩ C, so a miss on {A, B, C} first looks for the largest cached
+subset of its inputs — if A ∩ B is cached, only C still has to be intersected, and the
+cached result is usually far shorter than A or B. The remaining lists are folded in
+shortest first (intersect_with_skipping), and every intermediate result on the way is
+cached as well, so later queries can build on it. Union reuses subsets the same way,
+with union_many.
+
+Bounded size
+------------
+Results are stored as tuples (immutable, so they can be handed out without copying) in
+an LRU ordered by last use. The budget counts the bytes of the result containers; the
+int objects inside are shared with the source lists and aren't counted again. A result
+bigger than the whole budget is returned but not cached.
+"""
+
+from collections import OrderedDict
+from itertools import combinations
+import sys
+from typing import NamedTuple
+
+from .merge_arrays_1 import _iter_unique_from, intersect_with_skipping, union_many
+
+# subset reuse tries every subset of a query up to this size; bigger queries only try
+# the subsets that leave out one list
+_FULL_SUBSET_SEARCH = 6
+
+
+class CacheStats(NamedTuple):
+    hits: int  # the whole query was cached
+    partial_hits: int  # a cached subset was reused
+    misses: int  # computed from the source lists alone
+    evictions: int  # entries dropped to stay under max_bytes
+    invalidations: int  # entries dropped because an input's version changed
+    entries: int
+    bytes: int
+
+
+class IntersectionCache:
+    """
+    LRU cache of intersect / union results over registered sorted lists.
+
+    Args:
+        max_bytes : upper bound on the total size of cached results
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_bytes = max_bytes
+        self._lists = {}
+        self._versions = {}
+        self._entries = OrderedDict()  # key → (result tuple, size), least recently used first
+        self._by_list = {}  # list id → keys of the entries computed from it
+        self._bytes = 0
+        self._hits = self._partial_hits = self._misses = 0
+        self._evictions = self._invalidations = 0
+
+    def update(self, list_id, values) -> None:
+        """Register (or replace) the sorted list list_id, bumping its version."""
+        self._lists[list_id] = values
+        self.bump(list_id)
+
+    def bump(self, list_id) -> None:
+        """Mark list_id as changed (e.g. after mutating it in place)."""
+        self._versions[list_id] = self._versions.get(list_id, -1) + 1
+        for key in self._by_list.pop(list_id, ()):
+            if key in self._entries:
+                self._drop(key)
+                self._invalidations += 1
+
+    def version(self, list_id) -> int:
+        return self._versions[list_id]
+
+    def intersect(self, *list_ids) -> tuple:
+        """The unique values common to every listed input, in increasing order."""
+        return self._query("intersect", list_ids)
+
+    def union(self, *list_ids) -> tuple:
+        """The unique values found in any of the listed inputs, in increasing order."""
+        return self._query("union", list_ids)
+
+    def _key(self, op, ids):
+        return op, frozenset((list_id, self._versions[list_id]) for list_id in ids)
+
+    def _query(self, op, list_ids):
+        if not list_ids:
+            raise TypeError(f"{op}() needs at least one list id")
+        ids = frozenset(list_ids)
+        missing = ids - self._lists.keys()
+        if missing:
+            raise KeyError(next(iter(missing)))
+        key = self._key(op, ids)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+        base_ids, base = self._largest_cached_subset(op, ids)
+        if base is None:
+            self._misses += 1
+            base_ids = frozenset()
+        else:
+            self._partial_hits += 1
+        if op == "union":
+            rest = [self._lists[i] for i in ids - base_ids]
+            result = tuple(union_many(*rest) if base is None else union_many(base, *rest))
+        else:
+            result = self._intersect_caching_steps(ids, base_ids, base)
+        self._store(key, ids, result)
+        return result
+
+    def _intersect_caching_steps(self, ids, base_ids, base):
+        """Fold the remaining lists in shortest first, caching every intermediate result."""
+        rest = sorted(ids - base_ids, key=lambda i: len(self._lists[i]))
+        if base is None:
+            first = rest.pop(0)
+            covered = {first}
+            result = self._lists[first]
+            if not rest:
+                return tuple(_iter_unique_from(result, 0))
+        else:
+            covered = set(base_ids)
+            result = base
+        for list_id in rest:
+            result = tuple(intersect_with_skipping(result, self._lists[list_id]))
+            covered.add(list_id)
+            if len(covered) < len(ids):
+                key = self._key("intersect", covered)
+                if key not in self._entries:
+                    self._store(key, frozenset(covered), result)
+        return result
+
+    def _largest_cached_subset(self, op, ids):
+        if len(ids) < 3:
+            return None, None
+        sizes = range(len(ids) - 1, 1, -1) if len(ids) <= _FULL_SUBSET_SEARCH else (len(ids) - 1,)
+        for size in sizes:
+            for subset in combinations(ids, size):
+                key = self._key(op, subset)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    return frozenset(subset), entry[0]
+        return None, None
+
+    def _store(self, key, ids, result):
+        size = sys.getsizeof(result)
+        if size > self.max_bytes:
+            return
+        while self._bytes + size > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+        self._entries[key] = (result, size)
+        self._bytes += size
+        for list_id in ids:
+            self._by_list.setdefault(list_id, set()).add(key)
+
+    def _drop(self, key):
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+        for list_id, _version in key[1]:
+            keys = self._by_list.get(list_id)
+            if keys is not None:
+                keys.discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_list.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._partial_hits,
+            self._misses,
+            self._evictions,
+            self._invalidations,
+            len(self._entries),
+            self._bytes,
+        )
+
+
+def bench_query_mix(lists=40, queries=1000, update_every=100):
+    """A skewed mix of repeated 2-4 list intersections, with an occasional list update."""
+    import random
+    import time
+
+    from .merge_arrays_2 import intersect_three
+
+    rng = random.Random(0)
+    sources = {f"L{i}": sorted(rng.sample(range(1_000_000), rng.randint(1_000, 30_000))) for i in range(lists)}
+    names = sorted(sources)
+    combos = [tuple(rng.sample(names, rng.choice((2, 3, 4)))) for _ in range(300)]
+    # popular combinations repeat a lot; many 3- and 4-list queries share a pair
+    mix = [combos[min(int(rng.paretovariate(1.2)) - 1, len(combos) - 1)] for _ in range(queries)]
+    updates = {q: rng.choice(names) for q in range(update_every, queries, update_every)}
+
+    def uncached(ids):
+        lists = [sources[i] for i in ids]
+        if len(lists) == 3:
+            return intersect_three(*lists)
+        result = lists[0]
+        for other in lists[1:]:
+            result = intersect_with_skipping(result, other)
+        return result
+
+    start = time.perf_counter()
+    expected = [uncached(ids) for ids in mix]
+    print(f"uncached:  {time.perf_counter() - start:6.3f}s")
+
+    cache = IntersectionCache(max_bytes=8 << 20)
+    for name, values in sources.items():
+        cache.update(name, values)
+    start = time.perf_counter()
+    got = []
+    for q, ids in enumerate(mix):
+        if q in updates:
+            cache.bump(updates[q])  # same contents, new version: forces recomputation
+        got.append(cache.intersect(*ids))
+    print(f"cached:    {time.perf_counter() - start:6.3f}s")
+    assert [list(r) for r in got] == expected
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    cache = IntersectionCache()
+    cache.update("a", [1, 2, 3, 4, 5, 6])
+    cache.update("b", [2, 4, 6, 8])
+    cache.update("c", [4, 5, 6, 7])
+    print(cache.intersect("a", "b"))  # (2, 4, 6)
+    print(cache.intersect("b", "a", "c"))  # (4, 6): reuses a ∩ b
+    print(cache.union("b", "c"))  # (2, 4, 5, 6, 7, 8)
+    cache.update("b", [4, 8])  # new version: drops every entry built on b
+    print(cache.intersect("a", "b"), cache.stats())
+    bench_query_mix()
@@ -0,0 +1,209 @@
+"""
+Problem: Merge sorted records, not just sorted integers
+
+merge_arrays (merge_arrays_1.py) merges bare integers. Real inputs are records — a sorted
+key column (timestamps, say) with one or more payload columns alongside — and the
+obvious ways to merge them are slow:
+    zip the columns into tuples and merge those: one tuple per record, and every
+        comparison compares tuples (and then payloads on equal keys)
+    heapq.merge(..., key=itemgetter(0)): one key call per record, plus the heap's
+        Python-level bookkeeping
+Either way the payloads are dragged through every comparison although only the keys
+decide the order.
+
+Key idea: split "where does each record go" from "move the records"
+---------------------------------------------------------------------
+1. Compute the merge permutation from the key columns alone.
+2. Gather every payload column through that permutation in one bulk pass.
+
+Lists / array.array
+    Concatenate the two key columns and sort the positions by key:
+        order = sorted(range(len(A) + len(B)), key=keys.__getitem__)
+    The key function is a C slot wrapper (no Python frame per record), and timsort
+    spots the two sorted runs and merges them in O(n + m) comparisons. Each payload
+    column is then gathered with map(column.__getitem__, order), also in C.
+NumPy
+    Every record's output position is known directly (the co-rank idea from
+    parallel_merge.py, one element at a time):
+        pos_a[i] = i + (number of B keys that go before A[i])
+        pos_b[j] = j + (number of A keys that go before B[j])
+    Both counts are one np.searchsorted call, and each column is placed with one
+    scatter: out[pos_a] = a_col; out[pos_b] = b_col.
+
+Stability
+---------
+merge_arrays' contract leaves the order of equal elements open. Here it's fixed: each
+input keeps its own order, and on equal keys all of A's records come before B's
+(ties="a", the default) or all of B's before A's (ties="b"). On the NumPy path that's
+exactly the choice of searchsorted side: "left" for the first source, "right" for the
+second.
+"""
+
+from array import array
+from typing import NamedTuple
+
+
+class MergedRecords(NamedTuple):
+    keys: object  # the merged key column
+    payloads: list  # the merged payload columns, in the order they were given
+
+
+def _concat(first, second):
+    """first followed by second, keeping the container type where it allows."""
+    if isinstance(first, array) and isinstance(second, array) and first.typecode == second.typecode:
+        return first + second
+    if isinstance(first, list) and isinstance(second, list):
+        return first + second
+    return list(first) + list(second)
+
+
+def _gather(column, order, like, name):
+    gathered = map(column.__getitem__, order)
+    if not isinstance(like, array):
+        return list(gathered)
+    try:
+        return array(like.typecode, gathered)
+    except (TypeError, OverflowError) as exc:
+        raise ValueError(f"{name}: B's values don't fit A's array({like.typecode!r}): {exc}") from None
+
+
+def merge_permutation(A_keys, B_keys, ties: str = "a"):
+    """
+    Return the merge order of two sorted key columns, as positions into A + B.
+
+    order[k] < len(A_keys) means output record k is A's record order[k]; otherwise it's
+    B's record order[k] - len(A_keys).
+    """
+    if ties not in ("a", "b"):
+        raise ValueError(f"ties must be 'a' or 'b', not {ties!r}")
+    n = len(A_keys)
+    if ties == "a":
+        keys = _concat(A_keys, B_keys)
+        return sorted(range(len(keys)), key=keys.__getitem__)
+    # B first on ties: sort B + A (stable), then renumber into A + B positions
+    m = len(B_keys)
+    keys = _concat(B_keys, A_keys)
+    return [i + n if i < m else i - m for i in sorted(range(len(keys)), key=keys.__getitem__)]
+
+
+def merge_records(A_keys, A_payloads, B_keys, B_payloads, ties: str = "a") -> MergedRecords:
+    """
+    Merge two sorted record sets given as columns.
+
+    Args:
+        A_keys, B_keys : key columns, each sorted in non decreasing order (list,
+            array.array or NumPy array)
+        A_payloads, B_payloads : sequences of payload columns, one per field, each as
+            long as its key column; A and B must have the same number of fields
+        ties : "a" puts A's records first on equal keys, "b" puts B's first
+
+    A merged column has the type of A's column. Two array.array columns that are merged
+    together must have the same typecode (NumPy columns are promoted instead); ValueError
+    names the column otherwise.
+    """
+    if len(A_payloads) != len(B_payloads):
+        raise ValueError("A and B must have the same number of payload columns")
+    for keys, columns in ((A_keys, A_payloads), (B_keys, B_payloads)):
+        if any(len(column) != len(keys) for column in columns):
+            raise ValueError("every payload column must be as long as its key column")
+    columns = [A_keys, B_keys, *A_payloads, *B_payloads]
+    if any(type(c).__module__ == "numpy" for c in columns):
+        return _merge_records_np(A_keys, A_payloads, B_keys, B_payloads, ties)
+    names = ["key column", *(f"payload column {i}" for i in range(len(A_payloads)))]
+    for name, a_col, b_col in zip(names, [A_keys, *A_payloads], [B_keys, *B_payloads]):
+        # the merged column is an array of A's typecode: B's can't silently differ
+        if isinstance(a_col, array) and isinstance(b_col, array) and a_col.typecode != b_col.typecode:
+            raise ValueError(
+                f"{name}: A is array({a_col.typecode!r}) but B is array({b_col.typecode!r}); convert one to match"
+            )
+    order = merge_permutation(A_keys, B_keys, ties)
+    keys = _gather(_concat(A_keys, B_keys), order, A_keys, names[0])
+    payloads = [
+        _gather(_concat(a_col, b_col), order, a_col, name)
+        for name, a_col, b_col in zip(names[1:], A_payloads, B_payloads)
+    ]
+    return MergedRecords(keys, payloads)
+
+
+def _merge_records_np(A_keys, A_payloads, B_keys, B_payloads, ties):
+    # imported here rather than at module level: numpy is optional, and slow to import
+    import numpy as np
+
+    if ties not in ("a", "b"):
+        raise ValueError(f"ties must be 'a' or 'b', not {ties!r}")
+    a_keys, b_keys = np.asarray(A_keys), np.asarray(B_keys)
+    a_side, b_side = ("left", "right") if ties == "a" else ("right", "left")
+    pos_a = np.arange(len(a_keys)) + np.searchsorted(b_keys, a_keys, side=a_side)
+    pos_b = np.arange(len(b_keys)) + np.searchsorted(a_keys, b_keys, side=b_side)
+
+    def place(a_col, b_col):
+        a_col, b_col = np.asarray(a_col), np.asarray(b_col)
+        out = np.empty(len(a_col) + len(b_col), dtype=np.result_type(a_col, b_col))
+        out[pos_a] = a_col
+        out[pos_b] = b_col
+        return out
+
+    return MergedRecords(
+        place(a_keys, b_keys),
+        [place(a_col, b_col) for a_col, b_col in zip(A_payloads, B_payloads)],
+    )
+
+
+def bench_record_merge(n=1_000_000):
+    """Merge two n-record (timestamp, value, label) sets: tuples vs key= vs columns."""
+    import heapq
+    from operator import itemgetter
+    import random
+    import time
+
+    from .merge_arrays_1 import merge_arrays
+
+    rng = random.Random(0)
+
+    def side():
+        ts = sorted(rng.randrange(10 * n) for _ in range(n))
+        return ts, [rng.random() for _ in range(n)], [f"r{i % 100}" for i in range(n)]
+
+    a, b = side(), side()
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<40} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    # columns in, columns out for every variant: the tuple-based ones pay for zipping the
+    # records up and splitting the result back into columns, as they would in real use
+    def unzip(rows):
+        return [list(map(itemgetter(k), rows)) for k in range(len(a))]
+
+    timed(
+        "zip + merge_arrays over tuples + unzip",
+        lambda: unzip(merge_arrays(list(zip(*a)), list(zip(*b)))),
+    )
+    columns = timed(
+        "zip + heapq.merge(key=...) + unzip",
+        lambda: unzip(list(heapq.merge(zip(*a), zip(*b), key=itemgetter(0)))),
+    )
+    merged = timed("merge_records, lists", lambda: merge_records(a[0], a[1:], b[0], b[1:]))
+    assert columns == [merged.keys, *merged.payloads]
+    timed(
+        "merge_records, array('q') / array('d')",
+        lambda: merge_records(array("q", a[0]), [array("d", a[1])], array("q", b[0]), [array("d", b[1])]),
+    )
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    a_np, b_np = [np.asarray(c) for c in a[:2]], [np.asarray(c) for c in b[:2]]
+    timed("merge_records, NumPy", lambda: merge_records(a_np[0], a_np[1:], b_np[0], b_np[1:]))
+
+
+if __name__ == "__main__":
+    a = ([1, 3, 3, 7], ["a1", "a3", "a3'", "a7"])
+    b = ([2, 3, 8], ["b2", "b3", "b8"])
+    print(merge_records(a[0], [a[1]], b[0], [b[1]]))
+    # MergedRecords(keys=[1, 2, 3, 3, 3, 7, 8], payloads=[['a1', 'b2', 'a3', "a3'", 'b3', 'a7', 'b8']])
+    print(merge_records(a[0], [a[1]], b[0], [b[1]], ties="b").payloads)
+    # [['a1', 'b2', 'b3', 'a3', "a3'", 'a7', 'b8']]
+    bench_record_merge()
@@ -123,5 +123,6 @@ def minSubArray(K, A):
     return A[best[0] : best[1] + 1]
 
 
-print(minSubArrayLen(15, [4, 5, 2, 7, 2, 6, 8, 1, 7, 9, 6]))
-print(minSubArray(15, [4, 5, 2, 7, 2, 6, 8, 1, 7, 9, 6]))
+if __name__ == "__main__":
+    print(minSubArrayLen(15, [4, 5, 2, 7, 2, 6, 8, 1, 7, 9, 6]))
+    print(minSubArray(15, [4, 5, 2, 7, 2, 6, 8, 1, 7, 9, 6]))
@@ -0,0 +1,273 @@
+"""
+Problem: How many subarrays have sum exactly K / at least K?
+
+shortest_subarray_at_least_k (min_subarray_with_negatives.py) finds the shortest window
+with sum >= k; alerting also wants to know how many windows qualify. Checking every
+(i, j) pair is O(n^2). With prefix sums P (prefix_sums.py), sum(nums[i:j]) = P[j] - P[i],
+so both questions become counts over pairs of prefixes:
+    exactly K:   #{ i < j : P[i] == P[j] - K }
+    at least K:  #{ i < j : P[i] <= P[j] - K }
+Scanning j left to right, each is "how many earlier prefixes are equal to / at most a
+target" — a lookup in whatever structure holds the prefixes seen so far.
+
+Exactly K: prefix-frequency hash map, O(n)
+------------------------------------------
+A Counter of the prefixes seen so far answers "how many equal P[j] - K" in O(1), and
+needs nothing but the current prefix, so it works on a stream.
+
+At least K: counting over prefix ranks, O(n log n)
+--------------------------------------------------
+"How many earlier prefixes are <= T" needs order, not just equality:
+    Fenwick tree  compress the prefixes to ranks (sorted distinct values) and keep a
+                  FenwickTree of rank counts; each j is one prefix_sum query and one add.
+                  The ranks need every prefix up front, so this materializes P.
+    stream        with values still arriving there are no ranks yet. A single sorted list
+                  (bisect to count, insort to add) looks fine while the prefixes drift
+                  upward — every insort lands at the end — but a zero-mean stream inserts
+                  in the middle, and the O(n) memmove per value made 1M values take ~170s.
+                  SubarraySumCounter keeps the prefixes in sorted buckets of at most
+                  2 * _BUCKET values instead, with a FenwickTree over the bucket sizes:
+                  counting is a bisect over the bucket maxima, a Fenwick prefix_sum and a
+                  bisect inside one bucket; adding is an insort into one bucket. A bucket
+                  that overflows is split in two and the (small) tree rebuilt.
+    NumPy         merge-sort counting, bottom up: at level w, the prefixes are cut into
+                  blocks of 2w and every right-half element counts the left-half elements
+                  of its own block that are <= its target. Shifting block b's ranks by
+                  b * span makes all the left halves one sorted array, so a level is one
+                  np.sort plus one np.searchsorted; log2(n) levels, no per-element loop.
+
+NumPy: exactly K
+----------------
+Sort the (rank, position) pairs as one int key rank * (n + 1) + position; the prefixes
+equal to a target that come before j are then one contiguous run, found by two
+np.searchsorted calls for all j at once.
+"""
+
+from bisect import bisect_right, insort
+from collections import Counter
+from itertools import accumulate
+
+from .prefix_sums import FenwickTree, PrefixSumIndex
+
+# SubarraySumCounter splits a bucket once it holds more than 2 * _BUCKET prefixes
+_BUCKET = 512
+
+
+def _prefixes(nums, backend):
+    """P for nums, reusing a PrefixSumIndex's prefix sums when given one."""
+    if backend != "numpy":
+        return list(nums.prefix) if isinstance(nums, PrefixSumIndex) else list(accumulate(nums, initial=0))
+    import numpy as np
+
+    if isinstance(nums, PrefixSumIndex):
+        return np.asarray(nums.prefix)
+    values = np.asarray(nums if hasattr(nums, "__len__") else list(nums))
+    P = np.zeros(len(values) + 1, dtype=np.result_type(values.dtype, np.int64))
+    np.cumsum(values, out=P[1:])
+    return P
+
+
+def _check_backend(backend):
+    if backend not in ("array", "numpy"):
+        raise ValueError(f"unknown backend {backend!r}")
+
+
+def count_subarrays_sum_exactly(nums, k, backend: str = "array") -> int:
+    """
+    Number of non-empty subarrays of nums whose sum is exactly k.
+
+    nums may be any iterable (it is consumed once) or a PrefixSumIndex.
+    backend : "array" counts with a hash map in one O(n) pass, "numpy" with sorting
+    """
+    _check_backend(backend)
+    if backend == "numpy":
+        return _count_exactly_np(_prefixes(nums, backend), k)
+    prefixes = nums.prefix if isinstance(nums, PrefixSumIndex) else accumulate(nums, initial=0)
+    seen = Counter()
+    count = 0
+    for p in prefixes:
+        count += seen[p - k]
+        seen[p] += 1
+    return count
+
+
+def count_subarrays_sum_at_least(nums, k, backend: str = "array") -> int:
+    """
+    Number of non-empty subarrays of nums whose sum is at least k.
+
+    nums may be any iterable (it is consumed once) or a PrefixSumIndex.
+    backend : "array" counts with a Fenwick tree over prefix ranks, "numpy" with
+        vectorized merge-sort counting; both O(n log n)
+    """
+    _check_backend(backend)
+    P = _prefixes(nums, backend)
+    if backend == "numpy":
+        return _count_at_least_np(P, k)
+    values = sorted(set(P))
+    rank = {v: r for r, v in enumerate(values)}
+    seen = FenwickTree([0] * len(values))
+    count = 0
+    for p in P:
+        # earlier prefixes <= p - k are exactly those with rank < bisect_right(values, p - k)
+        count += seen.prefix_sum(bisect_right(values, p - k))
+        seen.add(rank[p], 1)
+    return count
+
+
+class _SortedBuckets:
+    """A sorted multiset of numbers, as sorted buckets plus a FenwickTree of their sizes."""
+
+    __slots__ = ("_buckets", "_maxes", "_sizes")
+
+    def __init__(self, first):
+        self._buckets = [[first]]
+        self._maxes = [first]
+        self._sizes = FenwickTree([1])
+
+    def count_at_most(self, x) -> int:
+        b = bisect_right(self._maxes, x)  # buckets [0, b) hold only values <= x
+        count = self._sizes.prefix_sum(b)
+        if b < len(self._buckets):
+            count += bisect_right(self._buckets[b], x)
+        return count
+
+    def add(self, x) -> None:
+        b = min(bisect_right(self._maxes, x), len(self._buckets) - 1)
+        bucket = self._buckets[b]
+        insort(bucket, x)
+        self._maxes[b] = bucket[-1]
+        if len(bucket) <= 2 * _BUCKET:
+            self._sizes.add(b, 1)
+            return
+        self._buckets[b : b + 1] = bucket[:_BUCKET], bucket[_BUCKET:]
+        self._maxes[b : b + 1] = bucket[_BUCKET - 1], bucket[-1]
+        self._sizes = FenwickTree(map(len, self._buckets))
+
+
+class SubarraySumCounter:
+    """
+    Running counts of the subarrays with sum exactly k and at least k, over a stream.
+
+    Feed values with push / extend; after each one, exactly and at_least cover every
+    subarray of everything pushed so far. O(1) per value for exactly, O(log n + _BUCKET)
+    for at_least (the bucket part is a memmove).
+    """
+
+    __slots__ = ("k", "exactly", "at_least", "_prefix", "_seen", "_sorted")
+
+    def __init__(self, k):
+        self.k = k
+        self.exactly = 0
+        self.at_least = 0
+        self._prefix = 0
+        self._seen = Counter({0: 1})
+        self._sorted = _SortedBuckets(0)
+
+    def push(self, value) -> None:
+        p = self._prefix = self._prefix + value
+        target = p - self.k
+        self.exactly += self._seen[target]
+        self.at_least += self._sorted.count_at_most(target)
+        self._seen[p] += 1
+        self._sorted.add(p)
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.push(value)
+
+
+def _ranks(P, targets):
+    """
+    Ranks of P among its distinct values, and for each target the number of distinct
+    values <= target: P[i] <= target exactly when rank[i] < that number.
+    """
+    import numpy as np
+
+    values, rank = np.unique(P, return_inverse=True)
+    return values, rank.reshape(-1), np.searchsorted(values, targets, side="right")
+
+
+def _count_exactly_np(P, k):
+    import numpy as np
+
+    n1 = len(P)
+    values, rank, upto = _ranks(P, P - k)
+    # the target's rank, where it is one of the prefix values at all
+    found = (upto > 0) & (values[np.maximum(upto - 1, 0)] == P - k)
+    key = np.sort(rank * n1 + np.arange(n1))
+    base = (upto[found] - 1) * n1
+    before = np.searchsorted(key, base + np.arange(n1)[found]) - np.searchsorted(key, base)
+    return int(before.sum())
+
+
+def _count_at_least_np(P, k):
+    import numpy as np
+
+    n1 = len(P)
+    _, rank, upto = _ranks(P, P - k)
+    span = n1 + 1  # ranks and upto are both in [0, n1]
+    positions = np.arange(n1)
+    count = 0
+    width = 1
+    while width < n1:
+        block = positions // (2 * width)
+        left = (positions // width) % 2 == 0
+        # left-half ranks of every block, shifted by block * span: one sorted array
+        keys = np.sort(block[left] * span + rank[left])
+        right_base = block[~left] * span
+        count += int(
+            (np.searchsorted(keys, right_base + upto[~left]) - np.searchsorted(keys, right_base)).sum()
+        )
+        width *= 2
+    return count
+
+
+def bench_subarray_counts(n=200_000, k=50):
+    """Count sum == k and sum >= k windows: O(n^2) brute force on a slice, then the real thing."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    nums = [rng.randint(-25, 25) for _ in range(n)]  # zero drift: the hard case for the stream
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<44} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    def brute(values):
+        exactly = at_least = 0
+        for i in range(len(values)):
+            total = 0
+            for x in values[i:]:
+                total += x
+                exactly += total == k
+                at_least += total >= k
+        return exactly, at_least
+
+    small = nums[:3000]
+    expected = timed(f"brute force, first {len(small)} values", lambda: brute(small))
+    assert (count_subarrays_sum_exactly(small, k), count_subarrays_sum_at_least(small, k)) == expected
+    print(f"{n} values:")
+    exactly = timed("count_subarrays_sum_exactly (Counter)", lambda: count_subarrays_sum_exactly(nums, k))
+    at_least = timed("count_subarrays_sum_at_least (Fenwick)", lambda: count_subarrays_sum_at_least(nums, k))
+    stream = SubarraySumCounter(k)
+    timed("SubarraySumCounter.extend (stream)", lambda: stream.extend(nums))
+    assert (stream.exactly, stream.at_least) == (exactly, at_least)
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    a = np.asarray(nums)
+    assert timed("count_subarrays_sum_exactly (numpy)", lambda: count_subarrays_sum_exactly(a, k, "numpy")) == exactly
+    assert timed("count_subarrays_sum_at_least (numpy)", lambda: count_subarrays_sum_at_least(a, k, "numpy")) == at_least
+
+
+if __name__ == "__main__":
+    print(count_subarrays_sum_exactly([1, 2, 3, -3, 3], 3))  # 5: [1,2] [3] [1,2,3,-3] [3,-3,3] and the last [3]
+    print(count_subarrays_sum_at_least([2, -1, 2, 1], 3))  # 3: [2,-1,2] [2,-1,2,1] [2,1]
+    counter = SubarraySumCounter(3)
+    counter.extend([2, -1, 2, 1])
+    print(counter.exactly, counter.at_least)  # 2 3
+    bench_subarray_counts()
@@ -0,0 +1,154 @@
+"""
+Problem: How much of a pattern occurs, in order, in a long event stream?
+
+isValidSubsequence2 (valid_subsequence_a2.py) answers yes or no. Log validation wants a
+score: the length of the longest common subsequence (LCS) of the stream and the expected
+pattern, or the longest prefix of the pattern that occurs in order. The textbook LCS DP
+fills an n x m table — O(n m) Python-level steps, far too slow for long streams.
+
+Bit-parallel LCS (Allison–Dix, in Hyyrö's formulation)
+------------------------------------------------------
+For a pattern of length m, one column of the DP table (the LCS of the stream so far with
+every pattern prefix) is encoded as an m-bit vector V:
+    bit i of V is 0  <=>  LCS(stream, pattern[:i + 1]) > LCS(stream, pattern[:i])
+so LCS(stream, pattern[:i]) is the number of zero bits among V's low i bits. Start with
+V = all ones (empty stream), precompute for each symbol c the match mask
+    M[c] = bits i with pattern[i] == c
+and for each event c of the stream:
+    U = V & M[c]
+    V = (V + U) | (V - U)
+The addition is the trick: the carry runs from each matched bit up to the next 1 bit,
+which updates a whole DP column at once. Python ints are arbitrary-width bit vectors whose
++, -, &, | run in C over 30-bit digits, so each event costs O(ceil(m / 30)) machine
+operations instead of m interpreter steps. At the end:
+    LCS length            = m - popcount(V)
+    longest matched prefix = number of trailing zero bits of V
+(the low i bits are all 0 exactly when all of pattern[:i] occurs in order).
+
+Many patterns at once: guard bits
+---------------------------------
+Patterns can share one big int: pattern k gets its own bit field, with one spare guard
+bit above it. U is a subset of V's bits, so V - U never borrows; V + U can carry out of a
+field, but only into its guard bit, which is 0 before the step and is cleared right after
+(V &= keep). Every event then updates all patterns with the same handful of big-int
+operations, and symbols that occur in no pattern (M[c] == 0) leave V unchanged and are
+skipped with one dict lookup.
+
+Measured (bench_lcs, 20k events, patterns of 10-300 symbols): the DP needs ~0.5s per
+pattern, lcs_length ~3ms; batching 50 patterns into one scorer is ~10x faster again than
+scoring them one by one, since the per-event interpreter overhead is paid once.
+"""
+
+from typing import List
+
+
+class SubsequenceScorer:
+    """
+    Bit-parallel LCS of one event stream against several patterns at once.
+
+    Feed the stream in any number of pieces with feed(); lcs_lengths() and
+    matched_prefixes() describe everything fed so far, one entry per pattern.
+    """
+
+    __slots__ = ("_lengths", "_offsets", "_masks", "_keep", "_V")
+
+    def __init__(self, patterns):
+        self._lengths = []
+        self._offsets = []
+        masks = {}
+        offset = 0
+        for pattern in patterns:
+            pattern = list(pattern)
+            for i, symbol in enumerate(pattern):
+                masks[symbol] = masks.get(symbol, 0) | 1 << (offset + i)
+            self._lengths.append(len(pattern))
+            self._offsets.append(offset)
+            offset += len(pattern) + 1  # + the guard bit
+        self._masks = masks
+        # every pattern bit set, every guard bit clear
+        self._keep = sum(((1 << m) - 1) << off for m, off in zip(self._lengths, self._offsets))
+        self._V = self._keep
+
+    def feed(self, events) -> None:
+        masks, keep = self._masks, self._keep
+        get = masks.get
+        V = self._V
+        for event in events:
+            M = get(event)
+            if M:
+                U = V & M
+                V = ((V + U) | (V - U)) & keep
+        self._V = V
+
+    def _fields(self):
+        V = self._V
+        for m, off in zip(self._lengths, self._offsets):
+            yield m, (V >> off) & ((1 << m) - 1)
+
+    def lcs_lengths(self) -> List[int]:
+        """LCS length of the stream with each pattern."""
+        return [m - field.bit_count() for m, field in self._fields()]
+
+    def matched_prefixes(self) -> List[int]:
+        """For each pattern, the length of its longest prefix found in order in the stream."""
+        return [m if not field else (field & -field).bit_length() - 1 for m, field in self._fields()]
+
+
+def lcs_length(array, sequence) -> int:
+    """Length of the longest common subsequence of array (the stream) and sequence."""
+    scorer = SubsequenceScorer([sequence])
+    scorer.feed(array)
+    return scorer.lcs_lengths()[0]
+
+
+def lcs_lengths(array, sequences) -> List[int]:
+    """lcs_length(array, s) for every s in sequences, in one pass over array."""
+    scorer = SubsequenceScorer(sequences)
+    scorer.feed(array)
+    return scorer.lcs_lengths()
+
+
+def _lcs_dp(array, sequence) -> int:
+    """The O(n m) DP, one row per stream event (reference for bench_lcs)."""
+    row = [0] * (len(sequence) + 1)
+    for event in array:
+        prev_diag = 0
+        for i, symbol in enumerate(sequence):
+            up = row[i + 1]
+            row[i + 1] = prev_diag + 1 if symbol == event else max(up, row[i])
+            prev_diag = up
+    return row[-1]
+
+
+def bench_lcs(n=20_000, patterns=50, alphabet=40):
+    """Score `patterns` expected event patterns (length 10-300) against an n-event stream."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    events = [f"ev{i}" for i in range(alphabet)]
+    stream = rng.choices(events, k=n)
+    expected = [rng.choices(events, k=rng.randint(10, 300)) for _ in range(patterns)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<44} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    few = expected[:3]
+    dp = timed(f"DP, {len(few)} patterns", lambda: [_lcs_dp(stream, p) for p in few])
+    assert timed(f"lcs_length, same {len(few)} patterns", lambda: [lcs_length(stream, p) for p in few]) == dp
+    one = timed(f"lcs_length per pattern, {patterns} patterns", lambda: [lcs_length(stream, p) for p in expected])
+    assert timed(f"lcs_lengths (batched), {patterns} patterns", lambda: lcs_lengths(stream, expected)) == one
+
+
+if __name__ == "__main__":
+    array = [5, 1, 22, 25, 6, -1, 8, 10]
+    print(lcs_length(array, [1, 6, -1, 10]))  # 4: the whole pattern, as isValidSubsequence2 says
+    scorer = SubsequenceScorer([[1, 6, 7, 10], [22, 8, 5], [9]])
+    scorer.feed(array[:4])
+    scorer.feed(array[4:])
+    print(scorer.lcs_lengths())  # [3, 2, 0]
+    print(scorer.matched_prefixes())  # [2, 2, 0]
+    bench_lcs()
@@ -151,9 +151,13 @@ def isValidSubsequence2(array, sequence):
 
 # That’s a real step forward.
 
+# Scoring instead of yes/no: subsequence_lcs.py measures how much of a pattern occurred
+# (LCS length, longest matched prefix) with bit-parallel big-int operations.
+
 # Next time, I’ll start pushing you to state invariants before coding.
 # That’s the habit that separates “knows Python” from “thinks like an engineer.”
 
 # When you’re ready, say the word and we’ll move to the next problem or tie this into NumPy/vectorization.
 
-print(isValidSubsequence2([1, 1, 1, 1], [1, 1]))
+if __name__ == "__main__":
+    print(isValidSubsequence2([1, 1, 1, 1], [1, 1]))
@@ -0,0 +1,138 @@
+"""
+Import-time budget check for the algorithms and python_notes_snippets packages.
+
+Every module is imported in a fresh interpreter under `python -X importtime`, and the
+check fails (exit status 1) if a module
+    - takes longer than the budget to import, counting everything its import pulls in,
+      stdlib and third-party included (one cumulative figure, nothing is exempt)
+    - prints anything while being imported
+    - fails to import at all
+The interpreter's own startup (site, encodings, sitecustomize, whatever .pth files
+load) is the baseline that gets subtracted: `python -X importtime -c pass` lists what a
+bare interpreter imports, and those modules are left out of every module's total. What
+remains is exactly what `import <module>` costs on top of an empty interpreter.
+A module over budget is measured again, up to --repeat times, and its fastest run
+counts: -X importtime is wall-clock, and one slow run on a busy machine shouldn't fail
+the check. The retries come after a sweep over all the other modules rather than right
+away, since slow runs come in bursts. Imports that fail or print aren't retried.
+Modules in EXCLUDED aren't checked at all: their import cost is what they are about (an
+asyncio server imports asyncio), and no budget that is useful for the rest covers them.
+
+tests/test_import_time.py runs the same check under pytest. Standalone, from src/:
+    python check_import_time.py [--budget-ms 50] [--repeat 5]
+"""
+
+import argparse
+import os
+import pkgutil
+import subprocess
+import sys
+
+PACKAGES = ("algorithms", "python_notes_snippets")
+SRC = os.path.dirname(os.path.abspath(__file__))
+BUDGET_MS = 50.0
+REPEAT = 5
+# module → why it isn't held to the budget
+EXCLUDED = {
+    "algorithms.arrays.query_service": "asyncio server; asyncio alone takes ~45-90 ms to import",
+}
+
+
+def iter_modules(packages=PACKAGES, exclude=EXCLUDED):
+    """Yield the dotted names of every module in the given packages, except those in exclude."""
+    for package in packages:
+        yield package
+        path = [os.path.join(SRC, *package.split("."))]
+        for info in pkgutil.walk_packages(path, prefix=f"{package}."):
+            if not info.name.endswith("__main__") and info.name not in exclude:
+                yield info.name
+
+
+def _importtime(code):
+    """Run code under -X importtime; returns (completed process, [(module, self us)])."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        imports.append((fields[2].strip(), int(fields[0])))
+    return proc, imports
+
+
+def startup_modules():
+    """The modules a bare interpreter imports before running any code: the baseline."""
+    proc, imports = _importtime("pass")
+    if proc.returncode != 0:
+        raise RuntimeError(f"bare interpreter failed: {proc.stderr.strip()}")
+    return frozenset(name for name, _ in imports)
+
+
+def import_time_us(module, baseline):
+    """
+    Import module in a fresh interpreter.
+
+    Returns (microseconds, stdout, stderr): the self time of every module the import
+    loaded that isn't in baseline, summed. The time is None if the import failed.
+    """
+    proc, imports = _importtime(f"import {module}")
+    if proc.returncode != 0 or module not in {name for name, _ in imports}:
+        return None, proc.stdout, proc.stderr
+    return sum(us for name, us in imports if name not in baseline), proc.stdout, proc.stderr
+
+
+def check_all(modules, baseline, budget_ms=BUDGET_MS, repeat=REPEAT):
+    """
+    Check every module against the budget.
+
+    Returns {module: (microseconds or None, problem)}; problem is "" for a pass.
+    """
+    budget_us = budget_ms * 1000
+    results = {}
+    for module in modules:
+        us, stdout, stderr = import_time_us(module, baseline)
+        if us is None:
+            results[module] = None, "FAILED: " + (stderr.strip().splitlines() or ["no output"])[-1]
+        elif stdout:
+            results[module] = us, f"prints on import: {stdout.strip().splitlines()[0]!r}"
+        else:
+            results[module] = us, ""
+    for _ in range(repeat - 1):
+        over = [m for m, (us, problem) in results.items() if not problem and us > budget_us]
+        if not over:
+            break
+        for module in over:
+            again, _, _ = import_time_us(module, baseline)
+            if again is not None and again < results[module][0]:
+                results[module] = again, ""
+    for module, (us, problem) in results.items():
+        if not problem and us > budget_us:
+            results[module] = us, f"over budget ({budget_ms:g} ms)"
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="per-module cumulative budget")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="runs for a module over budget; the fastest counts")
+    args = parser.parse_args(argv)
+
+    results = check_all(iter_modules(), startup_modules(), args.budget_ms, args.repeat)
+    for module, (us, problem) in results.items():
+        shown = "-" if us is None else f"{us / 1000:7.2f} ms"
+        print(f"{shown:>10}  {module}  {problem}".rstrip())
+    for module, reason in EXCLUDED.items():
+        print(f"{'excluded':>10}  {module}  ({reason})")
+    return 1 if any(problem for _, problem in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
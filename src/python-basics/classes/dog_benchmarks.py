@@ -0,0 +1,148 @@
+# Benchmarks for the Dog value class: memory per record, construction time, and the
+# hashing / comparison hot paths (set insertion, membership, sorting).
+# Run directly: python dog_benchmarks.py
+import random
+import time
+import tracemalloc
+from functools import total_ordering
+
+from hashable_and_comparable import Animal, Category, Dog
+from dog_table import DogTable
+
+
+@total_ordering
+class BaselineDog(Animal):
+    """Dog as it was originally written: per-instance __dict__, key recomputed on every call."""
+
+    # no __slots__ here → instances get a __dict__ back
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BaselineDog) and (self.name.lower(), self.category) == (
+            other.name.lower(),
+            other.category,
+        )
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, BaselineDog):
+            return NotImplemented
+        if self.category != other.category:
+            return NotImplemented
+        return self.name.lower() < other.name.lower()
+
+    def __hash__(self) -> int:
+        return hash((self.name.lower(), self.category))
+
+    def make_sound(self) -> str:
+        return "Woof!"
+
+
+@total_ordering
+class TotalOrderingDog(Animal):
+    """Dog's cached key, but with comparisons from total_ordering instead of ordered_by."""
+
+    __slots__ = ("_key", "_hash")
+
+    def __init__(self, name: str, category: Category):
+        super().__init__(name, category)
+        self._key = (category.value, name.casefold())
+        self._hash = hash(self._key)
+
+    def make_sound(self) -> str:
+        return "Woof!"
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        return isinstance(other, TotalOrderingDog) and self._key == other._key
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, TotalOrderingDog):
+            return NotImplemented
+        if self.category != other.category:
+            return NotImplemented
+        return self._key < other._key
+
+    __hash__ = Dog.__hash__
+
+
+N = 200_000
+CATEGORIES = list(Category)
+NAMES = [f"Dog{i}" for i in range(N)]
+ROWS = [(name, CATEGORIES[i % len(CATEGORIES)]) for i, name in enumerate(NAMES)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def measure(build):
+    """Return (seconds, bytes per record) for build(), which constructs N records."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return elapsed, size / N
+
+
+def build_table():
+    table = DogTable()
+    table.extend(ROWS)
+    return table
+
+
+def bench_layouts():
+    cases = {
+        "Dog (original)": lambda: [BaselineDog(name, c) for name, c in ROWS],
+        "Dog": lambda: [Dog(name, c) for name, c in ROWS],
+        "DogTable (columnar)": build_table,
+    }
+    for label, build in cases.items():
+        elapsed, per_record = measure(build)
+        print(f"{label:<22} {elapsed * 1e3:8.1f} ms  {per_record:6.1f} bytes/record")
+
+
+def bench_hot_paths():
+    """Set insertion, membership tests and sorting, before (BaselineDog) and after (Dog)."""
+    for cls in (BaselineDog, Dog):
+        dogs = [cls(name, c) for name, c in ROWS]
+        probes = [cls(name.upper(), c) for name, c in ROWS]
+        random.Random(0).shuffle(dogs)
+        # a single category, so the baseline can sort with __lt__ at all
+        same_category = [cls(name, Category.Dog) for name in NAMES]
+        random.Random(0).shuffle(same_category)
+        population = set(dogs)
+        results = {
+            "set insert": timed(lambda: set(dogs)),
+            "membership": timed(lambda: sum(p in population for p in probes)),
+            "sorted (__lt__)": timed(lambda: sorted(same_category)),
+        }
+        if cls is Dog:
+            results["sorted (sort_key)"] = timed(lambda: sorted(dogs, key=Dog.sort_key))
+        label = "Dog (original)" if cls is BaselineDog else "Dog"
+        print(label, "  ".join(f"{k}: {v * 1e3:.1f} ms" for k, v in results.items()))
+
+
+def bench_comparisons(number=500_000):
+    """Per-operator cost: total_ordering's generated wrappers vs ordered_by's direct methods."""
+    import timeit
+
+    for cls in (BaselineDog, TotalOrderingDog, Dog):
+        # equal names: the case where total_ordering's <= and >= need a second call
+        a, b = cls("Rex", Category.Dog), cls("rex", Category.Dog)
+        cells = []
+        for op in ("<", "<=", ">", ">=", "=="):
+            stmt = f"a {op} b"
+            best = min(timeit.repeat(stmt, globals={"a": a, "b": b}, number=number, repeat=5))
+            cells.append(f"{op}: {best / number * 1e9:4.0f} ns")
+        print(f"{cls.__name__:<17}", "  ".join(cells))
+
+
+if __name__ == "__main__":
+    bench_layouts()
+    bench_hot_paths()
+    bench_comparisons()
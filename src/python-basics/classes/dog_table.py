@@ -0,0 +1,56 @@
+# Columnar storage for Dog records
+# Instead of one object per record, DogTable keeps one column per field:
+#     names      → a list of str (the strings themselves are shared with the caller)
+#     categories → array('B') of Category values, one byte per record
+# A row only becomes a Dog object when it is read back, so a table of n records costs
+# roughly 9 bytes per record on top of the name strings, versus a full object per record.
+from array import array
+
+from hashable_and_comparable import Category, Dog
+
+# Category is a functional Enum with values 1..N, so its value doubles as an index here
+_CATEGORIES = (None, *Category)
+
+
+class DogTable:
+    """Parallel-array (columnar) store of Dog records."""
+
+    __slots__ = ("names", "categories")
+
+    def __init__(self):
+        self.names = []
+        self.categories = array("B")
+
+    @classmethod
+    def from_dogs(cls, dogs):
+        table = cls()
+        table.extend((dog.name, dog.category) for dog in dogs)
+        return table
+
+    def append(self, name: str, category: Category) -> None:
+        self.names.append(name)
+        self.categories.append(category.value)
+
+    def extend(self, rows) -> None:
+        """Append (name, category) pairs."""
+        for name, category in rows:
+            self.append(name, category)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i) -> Dog:
+        return Dog(self.names[i], _CATEGORIES[self.categories[i]])
+
+    def __iter__(self):
+        for name, value in zip(self.names, self.categories):
+            yield Dog(name, _CATEGORIES[value])
+
+    def __repr__(self) -> str:
+        return f"DogTable(<{len(self)} rows>)"
+
+
+if __name__ == "__main__":
+    table = DogTable.from_dogs([Dog("Rex", Category.Dog), Dog("Tom", Category.Cat)])
+    table.append("Leo", Category.Lion)
+    print(table, list(table))
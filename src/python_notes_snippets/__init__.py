@@ -0,0 +1,25 @@
+"""
+Python notes and snippets.
+
+Subpackages are loaded on first attribute access (PEP 562 module __getattr__), and no
+module runs its examples on import — demos only run under `python -m`, e.g.:
+    python -m python_notes_snippets.classes_examples.enums1
+"""
+
+import importlib
+
+_SUBPACKAGES = ("classes_examples", "files_and_exceptions", "misc")
+
+__all__ = list(_SUBPACKAGES)
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module  # cache: later lookups don't come back here
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
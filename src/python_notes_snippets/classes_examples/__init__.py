@@ -0,0 +1,40 @@
+"""
+Notes on classes: value classes, enums, multiple inheritance — plus the reusable pieces
+built on them (interning, fast enums, capability registry, batch dispatch, binary codec).
+
+Reusable names are importable from this package directly; each one's module is only
+imported the first time the name is looked up.
+"""
+
+import importlib
+
+# public name → submodule that defines it
+_EXPORTS = {
+    "Interner": "interning",
+    "TableEnum": "fast_enums",
+    "TableEnumMeta": "fast_enums",
+    "EnumDecoder": "fast_enums",
+    "DecodeResult": "fast_enums",
+    "Capable": "capabilities",
+    "has_capability": "capabilities",
+    "capabilities_of": "capabilities",
+    "filter_capable": "capabilities",
+    "batch_call": "batch_dispatch",
+    "constant_per_class": "batch_dispatch",
+    "RecordCodec": "binary_codec",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache: later lookups don't come back here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,169 @@
+# Batch method calls over mixed Animal collections
+#     [animal.make_sound() for animal in animals]
+# looks up make_sound on type(animal) and calls it through a Python-level frame, for
+# every single item. (No bound method is created — LOAD_METHOD has avoided that since
+# 3.7 — and since 3.11 the lookup is specialized per call site, so it's already cheap.)
+# In a collection of millions of animals there are usually only a handful of concrete
+# classes, so when the result only depends on the class, almost all of that work is
+# repeated.
+#
+# Methods whose result depends only on the class (Dog.make_sound → "Woof!") can be marked
+# with @constant_per_class. batch_call(animals, "make_sound") then
+#     1. set(map(type, animals)), one C-level pass, finds the distinct classes
+#     2. calls the method once per class, on its first object
+#     3. maps every object to its class's value: list(map(values.__getitem__, types))
+# so the method runs k times for k classes instead of n times, and the rest is C.
+#
+# That only pays when *every* class in the collection is constant for the method. As
+# soon as one class needs a real call per object, batch_call is the plain loop: grouping
+# those objects by class and scattering the results back into order costs more than the
+# dispatch it saves (an earlier version did that, and came out 1.5-2x slower than the
+# loop). "The plain loop" has to be the literal one, [obj.make_sound() for obj in objs]:
+# its call site gets specialized. getattr(obj, name)() or map(methodcaller(name), objs)
+# can't be, and cost 2x as much. So the loop is generated (exec) once per method name and
+# number of arguments, and cached.
+#
+# Caveats
+#     the method is looked up on the class, in the MRO, to find the @constant_per_class
+#         mark; classes that override __getattribute__, or where the name isn't found on
+#         the class (left to __getattr__ or an instance attribute), take the plain loop
+#     on the constant path an instance attribute of the same name shadowing the method
+#         is ignored (only each class's first object is asked), as is any per-object
+#         variation of a @constant_per_class method — that's what the mark promises
+#
+# What it buys (bench_batch_call, 2M animals, CPython 3.11)
+#     constant methods that do real work (lineage)   ~20x faster: it runs 3 times, not 2M
+#     trivial constant methods only (make_sound on Dogs and Cats)   about even: the
+#         specialized comprehension is already close to one dict lookup per item
+#     any non-constant class in the mix   the loop, plus the set() pass: ~5-20% slower
+from abc import ABC, abstractmethod
+import keyword
+
+_LOOPS = {}  # (method name, number of args) → generated plain loop
+
+
+def constant_per_class(func):
+    """Mark a method whose result depends only on the object's class (and the call's args)."""
+    func._constant_per_class = True
+    return func
+
+
+def _is_constant(cls, name) -> bool:
+    """True if obj.<name> resolves to a @constant_per_class attribute of cls for sure."""
+    if cls.__getattribute__ is not object.__getattribute__:
+        return False  # lookups are customised: only a real getattr knows
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return getattr(base.__dict__[name], "_constant_per_class", False)
+    return False  # not on the class: __getattr__ or an instance attribute supplies it
+
+
+def _plain_loop(name, nargs):
+    """[obj.<name>(*args) for obj in objs], with the attribute name written out."""
+    loop = _LOOPS.get((name, nargs))
+    if loop is None:
+        if not name.isidentifier() or keyword.iskeyword(name):
+            return lambda objs, *args: [getattr(obj, name)(*args) for obj in objs]
+        params = "".join(f", a{i}" for i in range(nargs))
+        namespace = {}
+        exec(f"def loop(objs{params}):\n    return [obj.{name}({params[2:]}) for obj in objs]", namespace)
+        loop = _LOOPS[name, nargs] = namespace["loop"]
+    return loop
+
+
+def batch_call(objs, name, *args) -> list:
+    """
+    Return [obj.<name>(*args) for obj in objs].
+
+    When every class in objs marks the method @constant_per_class, it is called once
+    per class; otherwise this is the plain loop.
+    """
+    if not isinstance(objs, (list, tuple)):
+        objs = list(objs)
+    classes = set(map(type, objs))
+    if not all(_is_constant(cls, name) for cls in classes):
+        return _plain_loop(name, len(args))(objs, *args)
+    types = list(map(type, objs))
+    values = {cls: getattr(objs[types.index(cls)], name)(*args) for cls in classes}
+    return list(map(values.__getitem__, types))
+
+
+class Animal(ABC):
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @abstractmethod
+    def make_sound(self) -> str:
+        """All animals must make sound."""
+
+    def speak(self, times: int = 1) -> str:
+        return f"{self.name}: " + " ".join([self.make_sound()] * times)
+
+    @constant_per_class
+    def lineage(self) -> str:
+        """The class and its bases, e.g. "Dog < Animal < ABC"."""
+        return " < ".join(cls.__name__ for cls in type(self).__mro__[:-1])
+
+
+class Dog(Animal):
+    __slots__ = ()
+
+    @constant_per_class
+    def make_sound(self) -> str:
+        return "Woof!"
+
+
+class Cat(Animal):
+    __slots__ = ()
+
+    @constant_per_class
+    def make_sound(self) -> str:
+        return "Meow!"
+
+
+class Parrot(Animal):
+    __slots__ = ("phrase",)
+
+    def __init__(self, name: str, phrase: str):
+        super().__init__(name)
+        self.phrase = phrase
+
+    def make_sound(self) -> str:  # depends on the object: not constant
+        return self.phrase
+
+
+def bench_batch_call(n=2_000_000):
+    """Time a plain comprehension against batch_call over a mixed collection."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    makers = (lambda i: Dog(f"d{i}"), lambda i: Cat(f"c{i}"), lambda i: Parrot(f"p{i}", f"hello {i % 10}"))
+    animals = [rng.choice(makers)(i) for i in range(n)]
+
+    dogs_and_cats = [a for a in animals if not isinstance(a, Parrot)]
+
+    for label, fn in (
+        ("[a.make_sound() for a in dogs_and_cats]", lambda: [a.make_sound() for a in dogs_and_cats]),
+        ("batch_call(dogs_and_cats, 'make_sound')", lambda: batch_call(dogs_and_cats, "make_sound")),
+        ("[a.make_sound() for a in animals]", lambda: [a.make_sound() for a in animals]),
+        ("batch_call(animals, 'make_sound')", lambda: batch_call(animals, "make_sound")),
+        ("[a.lineage() for a in animals]", lambda: [a.lineage() for a in animals]),
+        ("batch_call(animals, 'lineage')", lambda: batch_call(animals, "lineage")),
+        ("[a.speak(2) for a in animals]", lambda: [a.speak(2) for a in animals]),
+        ("batch_call(animals, 'speak', 2)", lambda: batch_call(animals, "speak", 2)),
+    ):
+        start = time.perf_counter()
+        fn()
+        print(f"{label:<40} {time.perf_counter() - start:6.3f}s")
+    for name, args in (("make_sound", ()), ("lineage", ()), ("speak", (2,))):
+        assert batch_call(animals, name, *args) == [getattr(a, name)(*args) for a in animals]
+
+
+if __name__ == "__main__":
+    animals = [Dog("Rex"), Parrot("Polly", "Hello!"), Cat("Tom"), Dog("Ace"), Parrot("Kiwi", "Bye!")]
+    print(batch_call(animals, "make_sound"))  # ['Woof!', 'Hello!', 'Meow!', 'Woof!', 'Bye!']
+    print(batch_call(animals, "speak", 2))
+    bench_batch_call()
@@ -0,0 +1,236 @@
+# Schema-compiled binary codec for value classes
+# multiple_inheritance1.py sketches a JSONSerializable mixin, and records like Dog4 / Dog5
+# (value_based_class.py) are easy to ship as JSON — but json.dumps of a list of dicts
+# spends its time building the dicts, dispatching on every value's type and formatting
+# numbers as text, and json.loads does it all again backwards.
+#
+# RecordCodec looks at a class once and compiles a fixed binary layout for it:
+#     int → "q", float → "d", bool → "?"     (struct codes, little endian)
+#     Enum → its ordinal in definition order, in the smallest of "B" / "H" / "I" that fits
+#            (the same numbering TableEnum and EnumDecoder use, see fast_enums.py)
+#     str / bytes → (offset, length) into a side buffer holding all the text, UTF-8
+# so every record is one struct.Struct of known size. Then it generates (exec) an encode
+# and a decode function with the fields unrolled in their source:
+#     encode: one pack_into(...) call per record, with every field expression written out
+#             (r.name.encode(), ordinal[r.category], r.age, ...): no loop over fields, no
+#             isinstance checks per value
+#     decode: struct.iter_unpack over the fixed part (C-level), and one constructor call
+#             per record, again with the field conversions written out
+#
+# Blob layout (encode_many → bytes, decode_many accepts bytes / bytearray / memoryview):
+#     header   magic b"RCD1", schema fingerprint (crc32 of the layout), record count,
+#              side buffer length
+#     fixed    count * record_size bytes
+#     side     the concatenated text
+# decode_many refuses a blob whose fingerprint doesn't match: a layout change can't be
+# misread silently. The layout includes each enum field's member values in order, since
+# adding or reordering a member shifts the ordinals without changing the struct format.
+#
+# Which classes: dataclasses (fields in declaration order), and plain or slotted classes
+# whose __init__ parameters are annotated and stored under the same attribute names
+# (Dog3 / Dog5 style). Decoding calls the class with the fields positionally, so
+# __init__ / __post_init__ validation still runs.
+#
+# Measured (bench_codec, 200k five-field records): json 0.66s encode / 0.92s decode,
+# RecordCodec 0.13s / 0.58s, and ~38 instead of ~102 bytes per record. Decoding gains the
+# least: about half of what's left is the frozen dataclass's own __init__, which the json
+# path pays just the same.
+import dataclasses
+import inspect
+import struct
+import typing
+import zlib
+from enum import Enum
+
+_MAGIC = b"RCD1"
+_HEADER = struct.Struct("<4sIQQ")  # magic, fingerprint, record count, side buffer length
+_SCALARS = {int: "q", float: "d", bool: "?"}
+
+
+def _fields_of(cls):
+    """[(name, type)] in constructor order."""
+    if dataclasses.is_dataclass(cls):
+        hints = typing.get_type_hints(cls)
+        return [(f.name, hints[f.name]) for f in dataclasses.fields(cls) if f.init]
+    hints = typing.get_type_hints(cls.__init__)
+    params = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    missing = [p.name for p in params if p.name not in hints]
+    if missing:
+        raise TypeError(f"{cls.__qualname__}.__init__ needs annotations for {missing}")
+    return [(p.name, hints[p.name]) for p in params]
+
+
+def _enum_code(enum_cls):
+    n = len(enum_cls)
+    return "B" if n <= 0xFF else "H" if n <= 0xFFFF else "I"
+
+
+class RecordCodec:
+    """
+    Fixed-layout binary encoder / decoder for lists of cls instances.
+
+    Args:
+        cls : a dataclass, or a class whose annotated __init__ parameters are stored as
+            attributes of the same names
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = _fields_of(cls)
+        if not self.fields:
+            raise TypeError(f"{cls.__qualname__} has no fields to encode")
+        namespace = {"cls": cls, "pack_into": None, "iter_unpack": None}
+        codes, encode_args, decode_args, unpack_names = [], [], [], []
+        text_fields = []
+        enum_values = []  # hashed into the fingerprint: enums travel as ordinals
+        for i, (name, tp) in enumerate(self.fields):
+            if isinstance(tp, type) and issubclass(tp, Enum):
+                members = tuple(tp)
+                enum_values.append(f"{name}={tuple(m.value for m in members)!r}")
+                namespace[f"ordinal{i}"] = {member: k for k, member in enumerate(members)}
+                namespace[f"members{i}"] = members
+                codes.append(_enum_code(tp))
+                encode_args.append(f"ordinal{i}[r.{name}]")
+                decode_args.append(f"members{i}[f{i}]")
+                unpack_names.append(f"f{i}")
+            elif tp in (str, bytes):
+                codes.append("QI")
+                text_fields.append((i, name, tp))
+                encode_args.append(f"o{i}, len(t{i})")
+                decode_args.append(
+                    f"str(side[o{i}:o{i} + n{i}], 'utf-8')" if tp is str else f"bytes(side[o{i}:o{i} + n{i}])"
+                )
+                unpack_names.extend((f"o{i}", f"n{i}"))
+            elif tp in _SCALARS:
+                codes.append(_SCALARS[tp])
+                encode_args.append(f"r.{name}")
+                decode_args.append(f"f{i}")
+                unpack_names.append(f"f{i}")
+            else:
+                raise TypeError(f"{cls.__qualname__}.{name}: no binary encoding for {tp!r}")
+        self.format = "<" + "".join(codes)
+        self._struct = struct.Struct(self.format)
+        self.record_size = self._struct.size
+        layout = f"{cls.__qualname__}|{self.format}|" + ",".join(name for name, _ in self.fields)
+        layout += "|" + ";".join(enum_values)
+        self.fingerprint = zlib.crc32(layout.encode())
+        namespace["pack_into"] = self._struct.pack_into
+        namespace["iter_unpack"] = self._struct.iter_unpack
+
+        # encode: every text field is encoded, appended to the side buffer and its offset
+        # taken before the one pack_into call for the record
+        text_lines = []
+        for i, name, tp in text_fields:
+            text_lines.append(f"        t{i} = r.{name}" + (".encode()" if tp is str else ""))
+            text_lines.append(f"        o{i} = pos; pos += len(t{i}); side_append(t{i})")
+        size = self.record_size
+        source = "\n".join(
+            [
+                "def encode(records, out, start):",
+                "    side = []",
+                "    side_append = side.append",
+                "    pos = 0",
+                "    for at, r in enumerate(records):",
+                *text_lines,
+                f"        pack_into(out, start + at * {size}, {', '.join(encode_args)})",
+                "    return side",
+                "",
+                "def decode(fixed, side):",
+                f"    return [cls({', '.join(decode_args)}) for ({', '.join(unpack_names)},) in iter_unpack(fixed)]",
+            ]
+        )
+        self.source = source
+        exec(compile(source, f"<RecordCodec {cls.__qualname__}>", "exec"), namespace)
+        self._encode = namespace["encode"]
+        self._decode = namespace["decode"]
+
+    def encode_many(self, records) -> bytes:
+        """Encode a sequence of records into one blob."""
+        records = records if isinstance(records, (list, tuple)) else list(records)
+        start = _HEADER.size
+        out = bytearray(start + len(records) * self.record_size)
+        try:
+            side = self._encode(records, out, start)
+        except (KeyError, AttributeError, struct.error) as exc:
+            raise ValueError(f"cannot encode {self.cls.__qualname__} records: {exc!r}") from exc
+        side = b"".join(side)
+        _HEADER.pack_into(out, 0, _MAGIC, self.fingerprint, len(records), len(side))
+        out += side
+        return bytes(out)
+
+    def decode_many(self, blob) -> list:
+        """Decode a blob made by encode_many (bytes, bytearray or memoryview; not copied)."""
+        view = memoryview(blob).cast("B")
+        if len(view) < _HEADER.size:
+            raise ValueError("blob too short for a header")
+        magic, fingerprint, count, side_len = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError(f"not a RecordCodec blob (magic {magic!r})")
+        if fingerprint != self.fingerprint:
+            raise ValueError(f"blob was written with a different layout than {self.cls.__qualname__}'s")
+        fixed_end = _HEADER.size + count * self.record_size
+        if len(view) != fixed_end + side_len:
+            raise ValueError("blob length doesn't match its header")
+        try:
+            return self._decode(view[_HEADER.size : fixed_end], view[fixed_end:])
+        except IndexError:
+            raise ValueError("blob holds an enum ordinal out of range") from None
+
+
+def bench_codec(n=200_000):
+    """Round-trip n records through json (list of dicts) and through RecordCodec."""
+    import json
+    import random
+    import time
+
+    from .value_based_class import Category
+
+    @dataclasses.dataclass(frozen=True, slots=True)
+    class Reading:
+        host: str
+        category: Category
+        sequence: int
+        value: float
+        ok: bool
+
+    rng = random.Random(0)
+    categories = list(Category)
+    records = [
+        Reading(f"host-{rng.randrange(500)}", rng.choice(categories), i, rng.random(), rng.random() < 0.9)
+        for i in range(n)
+    ]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<32} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    def to_json(rows):
+        return json.dumps(
+            [{"host": r.host, "category": r.category.value, "sequence": r.sequence, "value": r.value, "ok": r.ok} for r in rows]
+        ).encode()
+
+    def from_json(blob):
+        return [
+            Reading(d["host"], Category(d["category"]), d["sequence"], d["value"], d["ok"]) for d in json.loads(blob)
+        ]
+
+    text = timed("json encode", lambda: to_json(records))
+    assert timed("json decode", lambda: from_json(text)) == records
+    codec = timed("RecordCodec compile", lambda: RecordCodec(Reading))
+    blob = timed("RecordCodec.encode_many", lambda: codec.encode_many(records))
+    assert timed("RecordCodec.decode_many", lambda: codec.decode_many(blob)) == records
+    print(f"sizes: json {len(text) / n:.1f} bytes/record, binary {len(blob) / n:.1f} bytes/record")
+
+
+if __name__ == "__main__":
+    from .value_based_class import Category, Dog3, Dog4, Dog5
+
+    codec = RecordCodec(Dog4)
+    print(codec.format, codec.record_size)  # <QIB 13
+    blob = codec.encode_many([Dog4("Rex", Category.DOG), Dog4("Tom", Category.CAT)])
+    print(codec.decode_many(blob))  # [Dog4(name='Rex', category=<Category.DOG: 'dog'>), Dog4(name='Tom', ...)]
+    print(RecordCodec(Dog5).decode_many(RecordCodec(Dog5).encode_many([Dog5("Rex", Category.DOG)])))
+    print(RecordCodec(Dog3).decode_many(memoryview(RecordCodec(Dog3).encode_many([Dog3("Rex", Category.DOG)]))))
+    bench_codec()
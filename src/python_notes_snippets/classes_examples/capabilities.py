@@ -0,0 +1,176 @@
+# Capability registry for mixins
+# multiple_inheritance1.py composes capabilities out of mixins (WalkableMixin,
+# FlyableMixin) and the natural way to ask "can this object fly?" is
+#     hasattr(obj, "fly")          → walks the MRO dicts; a miss raises and swallows
+#                                    AttributeError internally, which is the slow case
+#     isinstance(obj, FlyableMixin) → scans type(obj).__mro__ (and goes through
+#                                    __instancecheck__ if the mixin is an ABC)
+# Both redo the same work for every object, although the answer only depends on the
+# class — and classes are created once.
+#
+# So we work it out once per class:
+#     every capability mixin gets one bit: declare_capability(WalkableMixin) for an
+#     existing mixin, or class SwimmableMixin(Capable, capability=True) for a new one;
+#     the bit is stored on the mixin itself (_capability_bit, looked up in the mixin's
+#     own __dict__ so that subclasses don't inherit it by mistake)
+#     every class gets a mask, the OR of the bits found in its MRO, the first time it's
+#     asked about. Any class: the classes of multiple_inheritance1.py don't know about
+#     this module, and neither do plain subclasses of a mixin.
+# The masks are cached in a WeakKeyDictionary, so the cache doesn't keep classes alive
+# (ones created at runtime get freed as usual, and drop out of it), and declaring a
+# capability clears it.
+# has_capability(obj, FlyableMixin) is then one cache lookup for type(obj) and one AND.
+# As a per-object check that is a Python-level call plus a weak-keyed lookup, so against
+# a single isinstance (a C builtin) it loses several times over (bench_capabilities:
+# ~0.45 vs ~0.07 us per object) — its wins are checks that would otherwise need several
+# isinstance/hasattr calls, and bulk filtering.
+#
+# filter_capable collects the distinct classes among the objects (set(map(type, objs)),
+# in C), turns the required mask into a {class: passes?} table for just those, and runs
+#     compress(objs, map(table.get, map(type, objs)))
+# so the whole loop over millions of objects stays in C, and requiring several
+# capabilities costs the same as requiring one.
+#
+# Caveat: a class's mask is fixed once it has been asked about. Assigning to __bases__
+# later doesn't change what it reports (isinstance would notice).
+from itertools import compress
+import weakref
+
+from .multiple_inheritance1 import Bird, FlyableMixin, Snake, WalkableMixin
+
+_CAPABILITIES = []  # weak references to the capability mixins, indexed by bit position
+_MASKS = weakref.WeakKeyDictionary()  # class → OR of the capability bits in its MRO
+
+
+def declare_capability(mixin):
+    """
+    Make mixin (any class) a capability, with a bit of its own; returns mixin.
+
+    Classes that subclass it, before or after, have the capability from then on.
+    """
+    if "_capability_bit" not in mixin.__dict__:
+        mixin._capability_bit = 1 << len(_CAPABILITIES)
+        _CAPABILITIES.append(weakref.ref(mixin))
+        _MASKS.clear()  # masks computed before may be missing the new bit
+    return mixin
+
+
+class Capable:
+    """
+    Base for declaring capability mixins: class M(Capable, capability=True).
+
+    Other classes don't need it; any class has the capabilities of the mixins in its MRO.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, capability: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if capability:
+            declare_capability(cls)
+
+
+def _mask(cls):
+    """The OR of the capability bits in cls's MRO, computed once per class."""
+    try:
+        return _MASKS[cls]
+    except KeyError:
+        mask = 0
+        for base in cls.__mro__:
+            mask |= base.__dict__.get("_capability_bit", 0)
+        _MASKS[cls] = mask
+        return mask
+
+
+def _bit(capability):
+    try:
+        return capability.__dict__.get("_capability_bit")
+    except AttributeError:
+        return None
+
+
+def _required_mask(capabilities):
+    mask = 0
+    for capability in capabilities:
+        bit = _bit(capability)
+        if bit is None:
+            raise TypeError(f"{capability!r} is not a capability mixin")
+        mask |= bit
+    return mask
+
+
+def has_capability(obj, capability, *more) -> bool:
+    """True if obj's class has every one of the given capability mixins in its MRO."""
+    try:
+        need = capability.__dict__["_capability_bit"] if not more else _required_mask((capability, *more))
+    except (AttributeError, KeyError):
+        need = _required_mask((capability,))  # raises the TypeError
+    return _mask(type(obj)) & need == need
+
+
+def capabilities_of(obj_or_cls) -> frozenset:
+    """The set of capability mixins an object (or class) has."""
+    cls = obj_or_cls if isinstance(obj_or_cls, type) else type(obj_or_cls)
+    mask = _mask(cls)
+    return frozenset(ref() for bit, ref in enumerate(_CAPABILITIES) if mask >> bit & 1 and ref() is not None)
+
+
+def filter_capable(objs, *capabilities) -> list:
+    """Return the objects (in order) whose class has every one of the given capabilities."""
+    need = _required_mask(capabilities)
+    if not isinstance(objs, (list, tuple)):
+        objs = list(objs)  # iterated twice below
+    table = {cls: _mask(cls) & need == need for cls in set(map(type, objs))}
+    return list(compress(objs, map(table.__getitem__, map(type, objs))))
+
+
+# The mixins and animals from multiple_inheritance1.py, the mixins declared as
+# capabilities, plus a new mixin and an animal that has it
+declare_capability(WalkableMixin)
+declare_capability(FlyableMixin)
+
+
+class SwimmableMixin(Capable, capability=True):
+    __slots__ = ()
+
+    def swim(self):
+        return f"{self.name} is swimming."
+
+
+class Duck(Bird, SwimmableMixin):
+    pass
+
+
+def bench_capabilities(n=2_000_000):
+    """Time per-object checks and bulk filtering: hasattr / isinstance vs the registry."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    kinds = (Bird, Duck, Snake)
+    objs = [rng.choice(kinds)("x") for _ in range(n)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<40} {time.perf_counter() - start:6.3f}s  ({len(result)} kept)")
+        return result
+
+    expected = timed("[o for o in objs if hasattr(o, 'fly')]", lambda: [o for o in objs if hasattr(o, "fly")])
+    timed("[... isinstance(o, FlyableMixin)]", lambda: [o for o in objs if isinstance(o, FlyableMixin)])
+    timed("[... has_capability(o, FlyableMixin)]", lambda: [o for o in objs if has_capability(o, FlyableMixin)])
+    assert timed("filter_capable(objs, FlyableMixin)", lambda: filter_capable(objs, FlyableMixin)) == expected
+    timed(
+        "[... isinstance x2 (fly and swim)]",
+        lambda: [o for o in objs if isinstance(o, FlyableMixin) and isinstance(o, SwimmableMixin)],
+    )
+    timed("filter_capable(objs, Flyable, Swimmable)", lambda: filter_capable(objs, FlyableMixin, SwimmableMixin))
+
+
+if __name__ == "__main__":
+    duck, snake = Duck("Donald"), Snake("Nagini")
+    print(has_capability(duck, FlyableMixin), has_capability(snake, WalkableMixin))  # True False
+    print(sorted(cap.__name__ for cap in capabilities_of(duck)))
+    print(filter_capable([Bird("Robin"), duck, snake], WalkableMixin, FlyableMixin))
+    print(duck.fly(), duck.swim())
+    bench_capabilities()
@@ -3,14 +3,16 @@ from enum import Enum
 # Using a dictionary for member names and values
 Status = Enum("Status", {"OK": 200, "NOT_FOUND": 404, "ERROR": 500})
 
-print(Status.OK)
-print(Status.NOT_FOUND.value)
+if __name__ == "__main__":
+    print(Status.OK)
+    print(Status.NOT_FOUND.value)
 
 # Using a list of names (values will be assigned automatically, starting from 1)
 Fruits = Enum("Fruits", ["APPLE", "BANANA", "ORANGE"])
 
-print(Fruits.APPLE.value)  # Output: 1
-print(Fruits.BANANA.name)
+if __name__ == "__main__":
+    print(Fruits.APPLE.value)  # Output: 1
+    print(Fruits.BANANA.name)
 
 
 class Category(Enum):
@@ -26,21 +28,25 @@ class Animal:
         self.age = age
 
 
-print(Category.mro())  # Method Resolution Order -- works for classes too.
+if __name__ == "__main__":
+    print(Category.mro())  # Method Resolution Order -- works for classes too.
 # Notes
 # 1. Enum members compare by identity.
-Category.DOG is Category.DOG  # True
+#     Category.DOG is Category.DOG  # True
 # 2. They’re type-safe
 # You can’t accidentally pass "dog" where a Category.DOG is expected.
 # 3. You can iterate them
-for c in Category:
-    print(c)
+if __name__ == "__main__":
+    for c in Category:
+        print(c)
 # 4. They’re hashable(immutable)
 # Useful for dict keys or sets.
 # If you want them uppercase but with lowercase values
+# (each variant below gets its own name: redefining Category over and over would build
+# and throw away a new Enum class every time the module is imported)
 
 
-class Category(Enum):
+class LabelledCategory(Enum):
     DOG = "dog"
     CAT = "cat"
 
@@ -49,13 +55,13 @@ class Category(Enum):
 from enum import auto
 
 
-class Category(Enum):
+class AutoCategory(Enum):
     DOG = auto()
     CAT = auto()
 
 
 # Enforce valid values-
-class Animal:
+class ValidatedAnimal:
     def __init__(self, name, category: Category):
         if not isinstance(category, Category):
             raise ValueError("category must be a Category enum")
@@ -73,27 +79,30 @@ class Animal:
 # Enum members can absolutely have behavior
 
 
-class Category(Enum):
+class SoundCategory(Enum):
     DOG = "dog"
     CAT = "cat"
     BIRD = "bird"
 
     def sound(self):
-        if self is Category.DOG:
+        if self is SoundCategory.DOG:
             return "Woof!"
-        elif self is Category.CAT:
+        elif self is SoundCategory.CAT:
             return "Meow!"
-        elif self is Category.BIRD:
+        elif self is SoundCategory.BIRD:
             return "Chirp!"
 
 
 # Usage:
-print(Category.DOG.sound())  # Woof!
-print(Category.CAT.sound())  # Meow!
+if __name__ == "__main__":
+    print(SoundCategory.DOG.sound())  # Woof!
+    print(SoundCategory.CAT.sound())  # Meow!
+# Note: the if/elif chain costs one comparison per member until it matches.
+# fast_enums.py replaces it with a per-member table indexed by a precomputed ordinal.
 # You can even give each enum constant its own behavior
 
 
-class Category(Enum):
+class MemberSoundCategory(Enum):
     DOG = ("dog", "Woof!")
     CAT = ("cat", "Meow!")
     BIRD = ("bird", "Chirp!")
@@ -106,13 +115,14 @@ class Category(Enum):
         return self._sound
 
 
-Category.DOG.sound()  # "Woof!"
-Category.CAT.sound()  # "Meow!"
+if __name__ == "__main__":
+    MemberSoundCategory.DOG.sound()  # "Woof!"
+    MemberSoundCategory.CAT.sound()  # "Meow!"
 
 # Can override methods per member
 
 
-class Category(Enum):
+class LambdaCategory(Enum):
     DOG = ("dog", lambda: "Woof!")
     CAT = ("cat", lambda: "Meow!")
 
@@ -0,0 +1,271 @@
+# Enums with precomputed dispatch tables and cached lookups
+# enums1.py shows three ways to give members behaviour:
+#     if self is Category.DOG: ... elif ...   → O(members) comparisons per call
+#     per-member attributes set in __init__
+#     per-member lambdas                      → attribute lookup + an extra call
+# For hot paths we want: one indexing operation per call, whatever the member count.
+#
+# TableEnum gives every member a dense ordinal (0, 1, 2, ... in definition order) when the
+# class is created, so any per-member data can live in a flat tuple indexed by it:
+#     _SOUNDS = Category.table({Category.DOG: "Woof!", ...})
+#     def sound(self): return _SOUNDS[self._ordinal]
+#
+# Lookups
+# Category(value) goes through EnumType.__call__ → Enum.__new__ → _value2member_map_,
+# several Python-level frames for what is at heart one dict lookup. TableEnum keeps
+# plain dict copies of the value and name maps, and its metaclass answers Category(value)
+# straight from the dict (falling back to the normal machinery on a miss, so errors and
+# _missing_ behave exactly as before). from_value / from_name expose the same lookups.
+import sys
+from array import array
+from enum import Enum, EnumMeta
+from typing import NamedTuple
+
+
+class TableEnumMeta(EnumMeta):
+    def __new__(metacls, cls, bases, classdict, **kwds):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+        for ordinal, member in enumerate(enum_class):
+            member._ordinal = ordinal
+        enum_class._by_value = dict(enum_class._value2member_map_)
+        enum_class._by_name = dict(enum_class._member_map_)
+        return enum_class
+
+    def __call__(cls, value, *args, **kwds):
+        if not args and not kwds:
+            by_value = cls.__dict__.get("_by_value")
+            if by_value is not None:
+                try:
+                    return by_value[value]
+                except (KeyError, TypeError):  # miss, or an unhashable value
+                    pass
+        return super().__call__(value, *args, **kwds)
+
+
+class TableEnum(Enum, metaclass=TableEnumMeta):
+    """Enum base with dense member ordinals, per-member tables and cached lookups."""
+
+    @classmethod
+    def table(cls, mapping):
+        """Return a tuple of mapping[member] for every member, indexable by member._ordinal."""
+        return tuple(mapping[member] for member in cls)
+
+    @classmethod
+    def from_value(cls, value):
+        try:
+            return cls._by_value[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
+
+    @classmethod
+    def from_name(cls, name):
+        return cls._by_name[name]
+
+
+class Category(TableEnum):
+    DOG = "dog"
+    CAT = "cat"
+    BIRD = "bird"
+
+    def sound(self):
+        return _SOUNDS[self._ordinal]
+
+
+_SOUNDS = Category.table({Category.DOG: "Woof!", Category.CAT: "Meow!", Category.BIRD: "Chirp!"})
+
+
+# Bulk decoding of raw columns
+# Decoding a column one value at a time with Category(value) pays EnumType.__call__ for
+# every row and stops at the first bad value. EnumDecoder builds its lookup structures
+# once per enum class and then decodes a whole column:
+#     list / array / any iterable → one C-level map(dict.get, column) pass
+#     NumPy integer arrays over a compact value range → a dense lookup array, indexed
+#         by (value - min) in one vectorized gather
+#     other NumPy arrays (strings, sparse ints) → np.unique, then one dict lookup per
+#         *distinct* value, scattered back with the inverse index
+# Invalid values never raise: they come back as None (or code -1) and are flagged in
+# the `invalid` mask, so callers can report all bad rows at once.
+# Codes are ordinals in definition order (the same numbering TableEnum uses).
+
+
+class DecodeResult(NamedTuple):
+    values: object  # members (None where invalid) or ordinal codes (-1 where invalid)
+    invalid: object  # bool per row: True where the raw value matched no member
+
+
+class EnumDecoder:
+    """Prebuilt lookup tables for decoding columns of raw values into enum_cls members."""
+
+    # value ranges up to this many slots (beyond the member count) get a dense lookup array
+    DENSE_SLACK = 1024
+
+    def __init__(self, enum_cls):
+        self.enum_cls = enum_cls
+        self.members = tuple(enum_cls)
+        # aliases map to their canonical member, as Enum(value) does
+        self.by_value = dict(enum_cls._value2member_map_)
+        ordinal_of = {member: i for i, member in enumerate(self.members)}
+        self.code_by_value = {value: ordinal_of[member] for value, member in self.by_value.items()}
+        self._dense = None
+        values = list(self.by_value)
+        if values and all(type(v) is int for v in values):
+            low, high = min(values), max(values)
+            if high - low < len(values) + self.DENSE_SLACK:
+                dense = [-1] * (high - low + 1)
+                for value, code in self.code_by_value.items():
+                    dense[value - low] = code
+                self._dense = (low, dense)
+
+    def decode(self, column, codes: bool = False) -> DecodeResult:
+        """
+        Decode a column of raw values.
+
+        Args:
+            column : a list, array.array, NumPy array or any iterable of raw values
+            codes : return ordinal codes (array('i') / int ndarray, -1 where invalid)
+                instead of member objects
+        """
+        # numpy is optional and slow to import: if it isn't loaded yet, column can't be
+        # an ndarray, so there is no need to import it just to find that out
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(column, np.ndarray):
+            return self._decode_ndarray(column, codes)
+        lookup = self.code_by_value if codes else self.by_value
+        missing = -1 if codes else None
+        try:
+            # map() + dict.get: the whole loop runs in C
+            out = list(map(lookup.get, column, [missing] * len(column)))
+        except TypeError:
+            # an unhashable value, or a column without len(): take the careful path
+            out = [self._lookup_one(lookup, value, missing) for value in column]
+        invalid = [value == missing for value in out] if codes else [value is None for value in out]
+        return DecodeResult(array("i", out) if codes else out, invalid)
+
+    @staticmethod
+    def _lookup_one(lookup, value, missing):
+        try:
+            return lookup.get(value, missing)
+        except TypeError:
+            return missing
+
+    def _decode_ndarray(self, column, codes):
+        import numpy as np
+
+        if self._dense is not None and column.dtype.kind in "iu":
+            low, table = self._dense
+            if not isinstance(table, np.ndarray):
+                table = np.asarray(table, dtype=np.int64)
+                self._dense = (low, table)
+            idx = column.astype(np.int64, copy=False) - low
+            in_range = (idx >= 0) & (idx < len(table))
+            out_codes = np.full(column.shape, -1, dtype=np.int64)
+            out_codes[in_range] = table[idx[in_range]]
+        elif column.dtype.kind == "O":
+            # np.unique sorts, and mixed objects ("dog", 5, None) don't compare: look each
+            # value up in the dict instead, unhashable ones counting as invalid
+            flat = column.ravel().tolist()
+            lookup = self.code_by_value
+            try:
+                found = list(map(lookup.get, flat, [-1] * len(flat)))
+            except TypeError:
+                found = [self._lookup_one(lookup, value, -1) for value in flat]
+            out_codes = np.array(found, dtype=np.int64).reshape(column.shape)
+        else:
+            uniques, inverse = np.unique(column, return_inverse=True)
+            unique_codes = np.fromiter(
+                (self._lookup_one(self.code_by_value, u.item(), -1) for u in uniques),
+                dtype=np.int64,
+                count=len(uniques),
+            )
+            out_codes = unique_codes[inverse.reshape(column.shape)]
+        invalid = out_codes < 0
+        if codes:
+            return DecodeResult(out_codes, invalid)
+        # one trailing None so that code -1 gathers None
+        members = np.array(self.members + (None,), dtype=object)
+        return DecodeResult(members[out_codes], invalid)
+
+
+def bench_dispatch(n=10**7):
+    """Time n calls of each sound() variant, and n value / name lookups."""
+    import time
+
+    class IfChain(Enum):
+        DOG = "dog"
+        CAT = "cat"
+        BIRD = "bird"
+
+        def sound(self):
+            if self is IfChain.DOG:
+                return "Woof!"
+            elif self is IfChain.CAT:
+                return "Meow!"
+            elif self is IfChain.BIRD:
+                return "Chirp!"
+
+    class Lambdas(Enum):
+        DOG = ("dog", lambda: "Woof!")
+        CAT = ("cat", lambda: "Meow!")
+        BIRD = ("bird", lambda: "Chirp!")
+
+        def __init__(self, label, speak_func):
+            self.label = label
+            self._speak = speak_func
+
+        def sound(self):
+            return self._speak()
+
+    def timed(label, fn, members):
+        # the same member sequence for every variant; BIRD is the worst case for the chain
+        stream = members * (n // len(members))
+        start = time.perf_counter()
+        for member in stream:
+            fn(member)
+        print(f"{label:<28} {time.perf_counter() - start:6.2f}s")
+
+    timed("if/elif chain sound()", IfChain.sound, list(IfChain))
+    timed("lambda sound()", Lambdas.sound, list(Lambdas))
+    timed("dispatch table sound()", Category.sound, list(Category))
+    values = [member.value for member in Category]
+    timed("Enum.__call__ (plain Enum)", IfChain, values)
+    timed("Category(value) (cached)", Category, values)
+    timed("Category.from_value", Category.from_value, values)
+    timed("Category[name]", Category.__getitem__, [member.name for member in Category])
+    timed("Category.from_name", Category.from_name, [member.name for member in Category])
+
+
+def bench_decode(n=10**6):
+    """Decode n raw status codes: one Status(value) call per row vs EnumDecoder."""
+    import random
+    import time
+
+    Status = Enum("Status", {"OK": 200, "NOT_FOUND": 404, "ERROR": 500})
+    rng = random.Random(0)
+    raw = [rng.choice((200, 404, 500)) for _ in range(n)]
+
+    start = time.perf_counter()
+    [Status(value) for value in raw]
+    print(f"Status(value) per row:      {time.perf_counter() - start:6.3f}s")
+
+    decoder = EnumDecoder(Status)
+    start = time.perf_counter()
+    decoder.decode(raw)
+    print(f"EnumDecoder.decode(list):   {time.perf_counter() - start:6.3f}s")
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    column = np.asarray(raw)
+    start = time.perf_counter()
+    decoder.decode(column, codes=True)
+    print(f"EnumDecoder.decode(ndarray, codes=True): {time.perf_counter() - start:6.3f}s")
+
+
+if __name__ == "__main__":
+    print(Category.DOG.sound(), Category("cat").sound(), Category.from_name("BIRD").sound())
+    print(Category("dog") is Category.DOG, [m._ordinal for m in Category])
+    decoder = EnumDecoder(Category)
+    print(decoder.decode(["dog", "fish", "bird"]))
+    print(decoder.decode(["dog", "fish", "bird"], codes=True))
+    bench_dispatch()
+    bench_decode()
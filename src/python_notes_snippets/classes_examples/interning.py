@@ -0,0 +1,144 @@
+# Interning (flyweight) factory for value objects
+# value_based_class.py shows that equal Dog3 instances collapse to one entry in a set —
+# but each construction still allocates a brand-new object. In a stream with lots of
+# repeated values we'd rather hand out the *same* instance for the same value:
+#     intern = Interner()
+#     a = intern(Dog3, "Rex", Category.DOG)
+#     b = intern(Dog3, "Rex", Category.DOG)
+#     a is b  → True
+# Payoffs:
+#     duplicates cost one pointer instead of one object
+#     __eq__ can short-circuit on identity (Dog3.__eq__ checks `self is other` first)
+#
+# How it works
+# The cache is a weak-value dict keyed by the value tuple (cls, *args). It never keeps
+# an instance alive by itself: once nobody else references it, the entry vanishes.
+# That's the right default for a flyweight — the cache can't leak.
+# (It's a plain dict of weakref.KeyedRef rather than a WeakValueDictionary: the lookup on
+# the hit path is then a C-level dict.get plus one call, which matters per record.)
+# The class must support weak references (plain classes do; slotted classes need a
+# __weakref__ slot — Dog5 uses weakref_slot=True for that).
+#
+# Bounded mode (maxsize=N)
+# Additionally keeps strong references to the N most recently requested instances in an
+# LRU (OrderedDict). Hot values then survive even when the caller drops them between
+# requests, and the strong side of the cache never grows past N.
+from collections import OrderedDict
+from weakref import KeyedRef
+
+
+class Interner:
+    """
+    Flyweight factory: equal constructor arguments give back the identical instance.
+
+    Args:
+        maxsize : if given, also keep the maxsize most recently used instances alive (LRU)
+    """
+
+    def __init__(self, maxsize=None):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._live = {}
+        self._recent = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        live = self._live
+
+        def _remove(ref):
+            # the instance died; drop its entry unless it was already replaced
+            if live.get(ref.key) is ref:
+                del live[ref.key]
+
+        self._remove = _remove
+
+    def __call__(self, cls, *args):
+        return self._intern(cls, (cls, *args), args)
+
+    def _intern(self, cls, key, args):
+        ref = self._live.get(key)
+        obj = None if ref is None else ref()
+        if obj is None:
+            self.misses += 1
+            obj = cls(*args)
+            self._live[key] = KeyedRef(obj, self._remove, key)
+        else:
+            self.hits += 1
+        if self.maxsize is not None:
+            recent = self._recent
+            recent[key] = obj
+            recent.move_to_end(key)
+            if len(recent) > self.maxsize:
+                recent.popitem(last=False)
+        return obj
+
+    def factory(self, cls):
+        """Return a constructor for cls that goes through this interner."""
+        live_get = self._live.get
+        intern = self._intern
+
+        def make(*args):
+            key = (cls, *args)
+            # hit path inlined: one dict lookup and one weakref call
+            if self.maxsize is None:
+                ref = live_get(key)
+                if ref is not None:
+                    obj = ref()
+                    if obj is not None:
+                        self.hits += 1
+                        return obj
+            return intern(cls, key, args)
+
+        return make
+
+    def __len__(self) -> int:
+        """Number of distinct live instances."""
+        return len(self._live)
+
+    def clear(self) -> None:
+        self._live.clear()
+        self._recent.clear()
+
+
+def bench_duplicate_stream(n=500_000, duplicate_rate=0.9):
+    """Memory and time for a stream where duplicate_rate of the records repeat earlier values."""
+    import random
+    import time
+    import tracemalloc
+
+    from .value_based_class import Category, Dog3, Dog4
+
+    rng = random.Random(0)
+    distinct = max(1, int(n * (1 - duplicate_rate)))
+    categories = list(Category)
+    pool = [(f"dog{i}", categories[i % len(categories)]) for i in range(distinct)]
+    stream = pool + [rng.choice(pool) for _ in range(n - distinct)]
+    rng.shuffle(stream)
+
+    for cls in (Dog3, Dog4):
+        for label in ("plain", "interned"):
+            make = cls if label == "plain" else Interner().factory(cls)
+            start = time.perf_counter()
+            records = [make(name, c) for name, c in stream]
+            elapsed = time.perf_counter() - start
+            del records
+            # measured in a second run, tracemalloc would distort the timing
+            make = cls if label == "plain" else Interner().factory(cls)
+            tracemalloc.start()
+            records = [make(name, c) for name, c in stream]
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del records
+            print(f"{cls.__name__} {label:<9} {elapsed * 1e3:8.1f} ms  {size / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    from .value_based_class import Category, Dog3, Dog5
+
+    intern = Interner(maxsize=2)
+    a = intern(Dog3, "Rex", Category.DOG)
+    b = intern(Dog3, "Rex", Category.DOG)
+    print(a is b, len(intern), intern.hits, intern.misses)  # True 1 1 1
+    print(intern(Dog5, "Rex", Category.DOG) is intern(Dog5, "Rex", Category.DOG))  # True
+    bench_duplicate_stream()
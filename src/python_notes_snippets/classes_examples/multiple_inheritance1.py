@@ -12,9 +12,10 @@ class C(A, B):
     pass
 
 
-c = C()
-c.say()
-print(C.mro())
+if __name__ == "__main__":
+    c = C()
+    c.say()
+    print(C.mro())
 
 # Notes -
 # 🧠 How Python makes it sane (MRO)
@@ -23,7 +24,7 @@ print(C.mro())
 #     how to walk the diamond hierarchy
 #     how to avoid ambiguity
 # You can see the order with:
-C.mro()
+#     C.mro()
 
 
 # Why Python allows it:
@@ -66,9 +67,9 @@ class Person(WalkMixin, TalkMixin):
 #  ├── Clickable
 #  ├── Draggable
 #  └── Focusable
-# The diamond occurs naturally:
-class Button(Widget, Clickable):
-    pass
+# The diamond occurs naturally (sketch only — Widget and Clickable aren't defined here):
+# class Button(Widget, Clickable):
+#     pass
 
 
 # Why it makes sense:
@@ -88,15 +89,17 @@ class Button(Widget, Clickable):
 # Validatable
 #  ├── UserValidatable
 #  └── OrderValidatable
-# Now define a clean data model:
-class User(JSONSerializable, UserValidatable):
-    pass
+# Now define a clean data model (sketch only — the bases aren't defined here):
+# class User(JSONSerializable, UserValidatable):
+#     pass
 
 
 # This works beautifully because the two behaviors are independent:
 #     Serialization → how data is converted
 #     Validation → how data is checked
 # They don’t overlap, and MRO handles ordering cleanly.
+# (For a BinarySerializable that's fast in bulk, see binary_codec.py: it compiles a class's
+# fields into a struct layout once instead of serializing field by field.)
 # Example 3.
 # ⭐ 3. An AI model layer that is both “Trainable” and “Inspectable”
 # This one you’ll actually see in ML codebases.
@@ -109,9 +112,9 @@ class User(JSONSerializable, UserValidatable):
 # Inspectable
 #  ├── ActivationsInspectable
 #  └── GradientsInspectable
-# Now you combine them:
-class InspectableDense(Dense, ActivationsInspectable):
-    pass
+# Now you combine them (sketch only — the bases aren't defined here):
+# class InspectableDense(Dense, ActivationsInspectable):
+#     pass
 
 
 # This is extremely useful when debugging neural nets.
@@ -180,13 +183,14 @@ class Snake(Animal):
     pass
 
 
-d = Dog("Rufus")
-b = Bird("Robin")
-s = Snake("Nagini")
+if __name__ == "__main__":
+    d = Dog("Rufus")
+    b = Bird("Robin")
+    s = Snake("Nagini")
 
-print(d.walk())  # Rufus is walking.
-print(b.fly())  # Robin is flying.
-print(b.walk())  # Robin is walking.
+    print(d.walk())  # Rufus is walking.
+    print(b.fly())  # Robin is flying.
+    print(b.walk())  # Robin is walking.
 
 # 🔥 Why this example makes sense for multiple inheritance
 # Because "walk" and "fly" describe capabilities, not types.
@@ -207,6 +211,11 @@ print(b.walk())  # Robin is walking.
 # Not complex event systems.
 # Just plain logic and real-world modeling.
 
+# Checking capabilities in bulk
+# hasattr(obj, "fly") / isinstance(obj, FlyableMixin) redo the MRO walk for every object.
+# capabilities.py records each class's capability set once, as a bitmask computed the
+# first time the class is checked, and filters whole lists against it.
+
 # A subclass does not need to define an __init__ method if it doesn’t need to do anything extra beyond what the base class already does.
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -239,10 +248,11 @@ class Dog(Animal):
 # Abstract method requirement
 # The only requirement for Dog is to implement all abstract methods (make_sound).
 # Once you implement them, you can instantiate the class:
-my_dog = Dog("Buddy", Category.Dog)
-print(my_dog.name)  # Buddy
-print(my_dog.category)  # Category.Dog
-print(my_dog.make_sound())  # Woof!
+if __name__ == "__main__":
+    my_dog = Dog("Buddy", Category.Dog)
+    print(my_dog.name)  # Buddy
+    print(my_dog.category)  # Category.Dog
+    print(my_dog.make_sound())  # Woof!
 
 
 # Optional __init__ in subclass
@@ -30,7 +30,8 @@ class Dog1(Animal):
         return "Woof!"
 
 
-Dog1("Rex", Category.DOG).speak()  # "Woof!"
+if __name__ == "__main__":
+    Dog1("Rex", Category.DOG).speak()  # "Woof!"
 
 # 2️⃣ Equality for value classes
 
@@ -48,10 +49,11 @@ class Dog2(Animal):
         return (self.name, self.category) == (other.name, other.category)
 
 
-Dog2("Rex", Category.DOG) == Dog2("Rex", Category.DOG)  # True
-Dog2("Rex", Category.DOG) == Dog2("Max", Category.DOG)  # False
-print(Dog2("Rex", Category.DOG) == Dog2("Rex", Category.DOG))
-print(Dog2("Rex", Category.DOG) == Dog2("Max", Category.DOG))
+if __name__ == "__main__":
+    Dog2("Rex", Category.DOG) == Dog2("Rex", Category.DOG)  # True
+    Dog2("Rex", Category.DOG) == Dog2("Max", Category.DOG)  # False
+    print(Dog2("Rex", Category.DOG) == Dog2("Rex", Category.DOG))
+    print(Dog2("Rex", Category.DOG) == Dog2("Max", Category.DOG))
 
 
 # 3️⃣ Hashable classes (usable as dict keys or in sets)
@@ -64,6 +66,8 @@ class Dog3(Animal):
         return "Woof!"
 
     def __eq__(self, other):
+        if self is other:  # interned instances (see interning.py) stop here
+            return True
         if not isinstance(other, Dog3):
             return False
         return (self.name, self.category) == (other.name, other.category)
@@ -75,13 +79,14 @@ class Dog3(Animal):
         return f"Dog3(name={self.name!r}, category={self.category!r})"
 
 
-d1 = Dog3("Rex", Category.DOG)
-d2 = Dog3("Rex", Category.DOG)
+if __name__ == "__main__":
+    d1 = Dog3("Rex", Category.DOG)
+    d2 = Dog3("Rex", Category.DOG)
 
-animal_set = {d1, d2}  # only one entry because they are equal
-print(len(animal_set))
-d = Dog3("Rex", Category.DOG)
-print(d)  # Dog(name='Rex', category=<Category.DOG: 'dog'>)
+    animal_set = {d1, d2}  # only one entry because they are equal
+    print(len(animal_set))
+    d = Dog3("Rex", Category.DOG)
+    print(d)  # Dog(name='Rex', category=<Category.DOG: 'dog'>)
 
 # 5️⃣ Notes on abstract base classes + value semantics
 # If your base class is abstract, it usually doesn’t define __eq__ or __hash__.
@@ -113,3 +118,51 @@ class Dog4:
 # __hash__	Make instances usable in sets/dicts, must match __eq__
 # __repr__	Debug-friendly string
 # __str__	User-friendly string (optional)
+
+# 7️⃣ Memory-lean value classes
+# Every instance above carries its own __dict__. With millions of records in sets/dicts
+# that dict is most of the memory. Two ways to drop it:
+#     hand-written __slots__ = ("name", "category") on a normal class
+#     @dataclass(slots=True) (Python 3.10+), which generates the __slots__ for you
+# Frozen + slots gives the same value semantics as Dog4, in a fixed-size object.
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Dog5:
+    name: str
+    category: Category
+
+    def speak(self):
+        return "Woof!"
+
+
+if __name__ == "__main__":
+    print(Dog5("Rex", Category.DOG) == Dog5("Rex", Category.DOG))  # True
+    print(hasattr(Dog5("Rex", Category.DOG), "__dict__"))  # False
+
+# Notes on slots
+#     slots=True builds a *new* class under the hood; the decorator returns it.
+#     A slotted class can't get new attributes at runtime (no __dict__ to put them in).
+#     No __weakref__ either, unless you ask for it (weakref_slot=True, Python 3.11+).
+#     Dog5 asks for it so it can be interned through a weak-value cache (interning.py).
+
+
+def bench_value_classes(n=200_000):
+    """Construction time and memory per record for Dog3 (plain), Dog4 (dataclass), Dog5 (slots)."""
+    import time
+    import tracemalloc
+
+    names = [f"dog{i}" for i in range(n)]
+    for cls in (Dog3, Dog4, Dog5):
+        tracemalloc.start()
+        start = time.perf_counter()
+        records = [cls(name, Category.DOG) for name in names]
+        elapsed = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        print(f"{cls.__name__}: {elapsed * 1e3:.1f} ms, {size / n:.1f} bytes/record")
+
+
+if __name__ == "__main__":
+    bench_value_classes()
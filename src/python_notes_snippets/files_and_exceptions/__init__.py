@@ -0,0 +1 @@
+"""Notes on files, paths and exceptions."""
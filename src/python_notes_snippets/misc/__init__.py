@@ -0,0 +1,31 @@
+"""
+Misc notes and challenges (the notebooks), plus the modules grown out of them.
+
+Reusable names are importable from this package directly; each one's module is only
+imported the first time the name is looked up.
+"""
+
+import importlib
+
+# public name → submodule that defines it
+_EXPORTS = {
+    "TemperatureAnalyzer": "temperature_analyzer",
+    "TemperatureStats": "temperature_analyzer",
+    "fused_stats": "temperature_analyzer",
+    "ThresholdIndex": "threshold_index",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache: later lookups don't come back here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
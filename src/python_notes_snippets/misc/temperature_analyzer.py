@@ -0,0 +1,285 @@
+# Mini Temperature Analyzer, grown up
+# challenge1.ipynb answers its four questions with four separate passes over temps:
+#     max(temps), min(temps), sum(temps) / len(temps), [i for i in ... if temps[i] > 30]
+# and the NumPy version does the same with np.max / np.min / np.mean / a boolean mask.
+# That's fine for a week of readings; for years of readings from many sensors every
+# extra pass is another trip through memory (and, in pure Python, another boxed float
+# per element).
+#
+# fused_stats answers all of them in one pass: a single Python loop keeps the running
+# count, total, min/max (with the day they happened) and the count above the threshold.
+# Because it only needs to see each reading once it also works on one-shot iterables
+# (generators, file readers), which the multi-pass version can't.
+#
+# TemperatureAnalyzer keeps one column of readings per sensor plus running aggregates,
+# so stats() is O(1) whatever the history length:
+#     add / extend      streaming updates; each new chunk is reduced once and folded
+#                       into the running aggregates
+#     add_rows          bulk (sensor, temp) rows, grouped by sensor first
+#     days_above        threshold queries, returning day indices (0-based positions in
+#                       that sensor's stream — the notebook prints day + 1)
+# With backend="numpy" chunks are reduced by one set of NumPy reductions (argmin,
+# argmax, sum, count_nonzero), group-by goes through a stable argsort, and days_above
+# returns ndarrays. Readings are stored as array('d') either way; NumPy reads them
+# through np.frombuffer, without a copy.
+from array import array
+from typing import NamedTuple
+
+
+class TemperatureStats(NamedTuple):
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    above: int  # readings strictly above the threshold
+    coldest_day: int  # index of the first minimum
+    hottest_day: int  # index of the first maximum
+
+
+def _chunk_stats(temps, threshold):
+    """One pass: (count, total, minimum, maximum, coldest_day, hottest_day, above)."""
+    it = iter(temps)
+    for first in it:
+        break
+    else:
+        return None
+    minimum = maximum = total = first
+    coldest = hottest = 0
+    above = 1 if first > threshold else 0
+    count = 1
+    for count, t in enumerate(it, 2):
+        total += t
+        if t < minimum:
+            minimum, coldest = t, count - 1
+        elif t > maximum:
+            maximum, hottest = t, count - 1
+        if t > threshold:
+            above += 1
+    return count, total, minimum, maximum, coldest, hottest, above
+
+
+def _chunk_stats_np(temps, threshold):
+    """The same tuple, from one set of NumPy reductions over an ndarray."""
+    import numpy as np
+
+    if not len(temps):
+        return None
+    coldest, hottest = int(temps.argmin()), int(temps.argmax())
+    return (
+        len(temps),
+        float(temps.sum()),
+        float(temps[coldest]),
+        float(temps[hottest]),
+        coldest,
+        hottest,
+        int(np.count_nonzero(temps > threshold)),
+    )
+
+
+def fused_stats(temps, threshold: float = 30.0) -> TemperatureStats:
+    """All of the notebook's statistics in one pass over temps (any iterable)."""
+    chunk = _chunk_stats(temps, threshold)
+    if chunk is None:
+        raise ValueError("fused_stats() arg is an empty sequence")
+    count, total, minimum, maximum, coldest, hottest, above = chunk
+    return TemperatureStats(count, minimum, maximum, total / count, above, coldest, hottest)
+
+
+class _SensorColumn:
+    """Readings for one sensor plus running aggregates over them."""
+
+    __slots__ = ("readings", "total", "minimum", "maximum", "coldest", "hottest", "above")
+
+    def __init__(self):
+        self.readings = array("d")
+        self.total = 0.0
+        self.minimum = self.maximum = None
+        self.coldest = self.hottest = -1
+        self.above = 0
+
+    def fold(self, chunk, offset):
+        """Merge the aggregates of a chunk that starts at day index offset."""
+        count, total, minimum, maximum, coldest, hottest, above = chunk
+        self.total += total
+        self.above += above
+        # strict comparisons keep the earliest day on ties, as in a single pass
+        if self.minimum is None or minimum < self.minimum:
+            self.minimum, self.coldest = minimum, offset + coldest
+        if self.maximum is None or maximum > self.maximum:
+            self.maximum, self.hottest = maximum, offset + hottest
+
+    def stats(self):
+        count = len(self.readings)
+        if not count:
+            raise ValueError("no readings")
+        return TemperatureStats(
+            count, self.minimum, self.maximum, self.total / count, self.above, self.coldest, self.hottest
+        )
+
+
+class TemperatureAnalyzer:
+    """
+    Per-sensor temperature columns with running statistics.
+
+    Args:
+        threshold : readings strictly above this count towards TemperatureStats.above
+        backend : "array" reduces new readings in a fused Python loop, "numpy" with
+            NumPy reductions (and returns ndarrays from days_above)
+    """
+
+    def __init__(self, threshold: float = 30.0, backend: str = "array"):
+        if backend not in ("array", "numpy"):
+            raise ValueError(f"unknown backend {backend!r}")
+        self.threshold = threshold
+        self.backend = backend
+        self._columns = {}
+
+    def _column(self, sensor):
+        column = self._columns.get(sensor)
+        if column is None:
+            column = self._columns[sensor] = _SensorColumn()
+        return column
+
+    def __len__(self) -> int:
+        return sum(len(column.readings) for column in self._columns.values())
+
+    @property
+    def sensors(self):
+        return list(self._columns)
+
+    def add(self, sensor, temp) -> None:
+        """Append one reading (streaming update, O(1))."""
+        column = self._column(sensor)
+        temp = float(temp)  # as stored in the column
+        column.fold((1, temp, temp, temp, 0, 0, 1 if temp > self.threshold else 0), len(column.readings))
+        column.readings.append(temp)
+
+    def extend(self, sensor, temps) -> None:
+        """Append a chunk of readings, reducing it once and folding it into the aggregates."""
+        column = self._column(sensor)
+        offset = len(column.readings)
+        if self.backend == "numpy":
+            import numpy as np
+
+            temps = np.ascontiguousarray(temps, dtype=np.float64)
+            chunk = _chunk_stats_np(temps, self.threshold)
+            column.readings.frombytes(temps.tobytes())
+        else:
+            column.readings.extend(temps)  # also takes one-shot iterables
+            chunk = _chunk_stats(column.readings[offset:], self.threshold)
+        if chunk is not None:
+            column.fold(chunk, offset)
+
+    def add_rows(self, sensors, temps) -> None:
+        """Append rows of (sensors[i], temps[i]), grouped by sensor; row order is kept per sensor."""
+        if self.backend == "numpy":
+            import numpy as np
+
+            sensors = np.asarray(sensors)
+            temps = np.asarray(temps, dtype=np.float64)
+            keys, codes = np.unique(sensors, return_inverse=True)
+            order = np.argsort(codes, kind="stable")  # stable: days stay in arrival order
+            bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+            grouped = temps[order]
+            for i, key in enumerate(keys.tolist()):
+                self.extend(key, grouped[bounds[i] : bounds[i + 1]])
+            return
+        groups = {}
+        for sensor, temp in zip(sensors, temps):
+            group = groups.get(sensor)
+            if group is None:
+                group = groups[sensor] = []
+            group.append(temp)
+        for sensor, group in groups.items():
+            self.extend(sensor, group)
+
+    def stats(self, sensor) -> TemperatureStats:
+        """Statistics over every reading of sensor, in O(1)."""
+        return self._columns[sensor].stats()
+
+    def summary(self) -> dict:
+        """{sensor: TemperatureStats} for every sensor with readings."""
+        return {sensor: column.stats() for sensor, column in self._columns.items() if column.readings}
+
+    def readings(self, sensor):
+        """
+        The sensor's readings: the array('d') itself, or a zero-copy ndarray view.
+
+        A live ndarray view pins the array's buffer, and appending to the sensor raises
+        BufferError until the view is dropped. ThresholdIndex(analyzer.readings(sensor))
+        copies the readings, so it is safe to keep.
+        """
+        readings = self._columns[sensor].readings
+        if self.backend == "numpy":
+            import numpy as np
+
+            return np.frombuffer(readings, dtype=np.float64)
+        return readings
+
+    def days_above(self, sensor, threshold=None):
+        """Day indices (0-based) of the sensor's readings strictly above threshold."""
+        if threshold is None:
+            threshold = self.threshold
+        readings = self.readings(sensor)
+        if self.backend == "numpy":
+            import numpy as np
+
+            return np.flatnonzero(readings > threshold)
+        return [day for day, t in enumerate(readings) if t > threshold]
+
+
+def bench_temperatures(days=3 * 365, sensors=1000, threshold=30.0):
+    """Multi-pass (the notebook) vs fused, in pure Python and NumPy, over sensors x days readings."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    n = days * sensors
+    temps = array("d", (rng.uniform(-10.0, 40.0) for _ in range(n)))
+    names = [f"s{i % sensors}" for i in range(n)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<36} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    def notebook(temps):
+        above = [i for i in range(len(temps)) if temps[i] > threshold]
+        return max(temps), min(temps), sum(temps) / len(temps), len(above)
+
+    print(f"{n} readings")
+    timed("notebook, 4 passes (Python)", lambda: notebook(temps))
+    fused = timed("fused_stats, 1 pass (Python)", lambda: fused_stats(temps, threshold))
+    timed("TemperatureAnalyzer.add_rows (array)", lambda: TemperatureAnalyzer(threshold).add_rows(names, temps))
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    a = np.frombuffer(temps, dtype=np.float64)
+    timed(
+        "notebook, 4 passes (NumPy)",
+        lambda: (np.max(a), np.min(a), np.mean(a), len(np.where(a > threshold)[0])),
+    )
+    chunk = timed("one reduction set (NumPy)", lambda: _chunk_stats_np(a, threshold))
+    assert chunk[6] == fused.above and chunk[4] == fused.coldest_day
+    analyzer = TemperatureAnalyzer(threshold, backend="numpy")
+    timed("TemperatureAnalyzer.add_rows (numpy)", lambda: analyzer.add_rows(np.array(names), a))
+    timed("stats() for every sensor", analyzer.summary)
+
+
+if __name__ == "__main__":
+    temps = [28, 32, 31, 29, 35, 27, 30]
+    stats = fused_stats(temps)
+    print(f"Hottest day temperature: {stats.maximum}°C")
+    print(f"Coldest day temperature: {stats.minimum}°C")
+    print(f"Average temperature: {stats.mean:.2f}°C")
+    print(f"Days above 30°C: {stats.above}")
+
+    analyzer = TemperatureAnalyzer(threshold=30)
+    analyzer.extend("roof", temps)
+    analyzer.add("roof", 36)  # a new day arrives
+    analyzer.add_rows(["cellar", "roof", "cellar"], [12, 29, 14])
+    print(analyzer.summary())
+    print("Roof above 30°C on days:", [day + 1 for day in analyzer.days_above("roof")])
+    bench_temperatures()
@@ -0,0 +1,248 @@
+# Sorted index for repeated threshold queries
+# challenge1.ipynb answers "which days were above 30°C?" with
+#     above_30 = temps > 30
+#     np.where(above_30)[0]
+# which is a full O(n) scan — fine once, wasteful when a dashboard asks for hundreds of
+# different thresholds over the same history.
+#
+# ThresholdIndex pays one O(n log n) argsort up front and keeps
+#     _sorted   the readings in ascending order
+#     _order    the day index of each of them (a stable argsort: equal readings stay in
+#               day order)
+# Then for any threshold x:
+#     readings > x are exactly _sorted[bisect_right(_sorted, x):]
+#     readings < x are exactly _sorted[:bisect_left(_sorted, x)]
+# so a count is O(log n), and the matching values / days are one slice: O(log n + k).
+#
+# Appends
+# Keeping the sorted arrays sorted on every append costs O(n) each. Instead new readings
+# go to a small unsorted delta buffer, which every query also scans (O(delta)), and the
+# buffer is merged in once it grows past delta_limit:
+#     the delta is sorted on its own (O(d log d)), each delta reading's position in the
+#     sorted base is found by binary search, and the base is copied around them in
+#     slices (array backend) or with np.insert (numpy) — O(n) copying, done in C
+# With the default delta_limit ~ sqrt(n), queries stay O(log n + sqrt(n) + k) and the
+# merges amortize to O(sqrt(n)) per append.
+#
+# Results come back in ascending value order (readings still in the delta buffer last),
+# or in day order with chronological=True, which sorts just the k results. That sort is
+# O(k log k) on boxed ints for the array backend: when k is a sizeable fraction of n it
+# costs about as much as the scan it replaces (see bench_thresholds), so ask for day
+# order only when you need it — the numpy backend sorts in C and doesn't mind.
+from array import array
+from bisect import bisect_left, bisect_right
+from math import isqrt
+
+
+class ThresholdIndex:
+    """
+    Sorted index over a series of readings, for "how many / which days above X" queries.
+
+    Args:
+        values : the readings, in day order
+        backend : "array" keeps the sorted data in arrays and searches with bisect,
+            "numpy" keeps ndarrays and searches with np.searchsorted
+        delta_limit : merge appended readings into the sorted index once more than this
+            many are buffered (default: about sqrt(len(values)), at least 64)
+    """
+
+    def __init__(self, values=(), backend: str = "array", delta_limit=None):
+        if backend not in ("array", "numpy"):
+            raise ValueError(f"unknown backend {backend!r}")
+        self.backend = backend
+        self._values = array("d", values)
+        self._delta_limit = delta_limit
+        self._delta = array("d")  # appended readings; their days follow len(_values)
+        if backend == "numpy":
+            import numpy as np
+
+            values = np.frombuffer(self._values, dtype=np.float64)
+            self._order = np.argsort(values, kind="stable")
+            self._sorted = values[self._order]
+        else:
+            values = self._values
+            self._order = array("q", sorted(range(len(values)), key=values.__getitem__))
+            self._sorted = array("d", map(values.__getitem__, self._order))
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._delta)
+
+    def append(self, value) -> None:
+        self._delta.append(value)
+        if len(self._delta) > self.delta_limit:
+            self.merge()
+
+    def extend(self, values) -> None:
+        self._delta.extend(values)
+        if len(self._delta) > self.delta_limit:
+            self.merge()
+
+    @property
+    def delta_limit(self) -> int:
+        if self._delta_limit is not None:
+            return self._delta_limit
+        return max(64, isqrt(len(self._values)))
+
+    def merge(self) -> None:
+        """Fold the delta buffer into the sorted index, in O(n + d log d)."""
+        delta = self._delta
+        if not delta:
+            return
+        base = len(self._values)
+        self._values.extend(delta)
+        self._delta = array("d")
+        if self.backend == "numpy":
+            import numpy as np
+
+            new = np.frombuffer(delta, dtype=np.float64)
+            new_order = np.argsort(new, kind="stable")
+            new_sorted = new[new_order]
+            # side="right": a new reading goes after equal old ones (its day is later)
+            at = np.searchsorted(self._sorted, new_sorted, side="right")
+            self._sorted = np.insert(self._sorted, at, new_sorted)
+            self._order = np.insert(self._order, at, new_order + base)
+        else:
+            values = self._values
+            old_sorted, old_order = self._sorted, self._order
+            new_sorted, new_order = array("d"), array("q")
+            prev = 0
+            # the delta in value order (stable: ties stay in day order); each reading goes
+            # after the equal old ones, whose days are earlier. Everything between two
+            # insertion points is copied as one slice, so the O(n) part runs in C.
+            for day in sorted(range(base, len(values)), key=values.__getitem__):
+                value = values[day]
+                at = bisect_right(old_sorted, value, prev)
+                new_sorted += old_sorted[prev:at]
+                new_order += old_order[prev:at]
+                new_sorted.append(value)
+                new_order.append(day)
+                prev = at
+            new_sorted += old_sorted[prev:]
+            new_order += old_order[prev:]
+            self._sorted, self._order = new_sorted, new_order
+
+    def _cut(self, x, above):
+        """Position in _sorted where readings > x (above) or < x (below) start/end."""
+        if self.backend == "numpy":
+            import numpy as np
+
+            return int(np.searchsorted(self._sorted, x, side="right" if above else "left"))
+        return bisect_right(self._sorted, x) if above else bisect_left(self._sorted, x)
+
+    def count_above(self, x) -> int:
+        """Number of readings strictly above x."""
+        in_delta = sum(1 for v in self._delta if v > x)
+        return len(self._sorted) - self._cut(x, above=True) + in_delta
+
+    def count_below(self, x) -> int:
+        """Number of readings strictly below x."""
+        in_delta = sum(1 for v in self._delta if v < x)
+        return self._cut(x, above=False) + in_delta
+
+    def _select(self, x, above, days, chronological):
+        cut = self._cut(x, above)
+        part = slice(cut, None) if above else slice(None, cut)
+        if not chronological:
+            found = self._order[part] if days else self._sorted[part]
+        else:
+            # sort just the k matching days; every base day is before every delta day,
+            # so the delta matches can simply follow
+            found = self._sorted_days(self._order[part])
+            if not days:
+                found = self._readings_at(found)
+        base = len(self._values)
+        delta = self._delta
+        if above:
+            extra = [base + i if days else v for i, v in enumerate(delta) if v > x]
+        else:
+            extra = [base + i if days else v for i, v in enumerate(delta) if v < x]
+        if not extra:
+            return found
+        if self.backend == "numpy":
+            import numpy as np
+
+            return np.concatenate([found, np.asarray(extra, dtype=found.dtype)])
+        return found + array(found.typecode, extra)
+
+    def _sorted_days(self, days):
+        if self.backend == "numpy":
+            import numpy as np
+
+            return np.sort(days)
+        return array("q", sorted(days))
+
+    def _readings_at(self, days):
+        if self.backend == "numpy":
+            import numpy as np
+
+            # fancy indexing copies, so the buffer export ends with this call
+            return np.frombuffer(self._values, dtype=np.float64)[days]
+        return array("d", map(self._values.__getitem__, days))
+
+    def values_above(self, x, chronological: bool = False):
+        """Readings strictly above x (ascending, or in day order if chronological)."""
+        return self._select(x, True, False, chronological)
+
+    def days_above(self, x, chronological: bool = False):
+        """Day indices of readings strictly above x (by value, or in day order if chronological)."""
+        return self._select(x, True, True, chronological)
+
+    def values_below(self, x, chronological: bool = False):
+        """Readings strictly below x (ascending, or in day order if chronological)."""
+        return self._select(x, False, False, chronological)
+
+    def days_below(self, x, chronological: bool = False):
+        """Day indices of readings strictly below x (by value, or in day order if chronological)."""
+        return self._select(x, False, True, chronological)
+
+
+def bench_thresholds(n=1_000_000, queries=200):
+    """Answer `queries` different thresholds: a full scan each (the notebook) vs the index."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    temps = array("d", (rng.uniform(-10.0, 40.0) for _ in range(n)))
+    thresholds = [rng.uniform(25.0, 40.0) for _ in range(queries)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<40} {time.perf_counter() - start:6.3f}s")
+        return result
+
+    print(f"{queries} thresholds over {n} readings")
+    expected = timed(
+        "count by scan per threshold (Python)",
+        lambda: [sum(1 for t in temps if t > x) for x in thresholds],
+    )
+    timed(
+        "days by scan per threshold (Python)",
+        lambda: [[day for day, t in enumerate(temps) if t > x] for x in thresholds],
+    )
+    index = timed("ThresholdIndex build (array)", lambda: ThresholdIndex(temps))
+    assert timed("count_above per threshold (array)", lambda: [index.count_above(x) for x in thresholds]) == expected
+    timed("days_above (array)", lambda: [index.days_above(x) for x in thresholds])
+    timed("days_above(chronological) (array)", lambda: [index.days_above(x, True) for x in thresholds])
+    timed("append x 10000 (array)", lambda: [index.append(t) for t in temps[:10_000]])
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    a = np.frombuffer(temps, dtype=np.float64)
+    timed("np.where(temps > x) per threshold", lambda: [np.where(a > x)[0] for x in thresholds])
+    index = timed("ThresholdIndex build (numpy)", lambda: ThresholdIndex(temps, backend="numpy"))
+    assert timed("count_above per threshold (numpy)", lambda: [index.count_above(x) for x in thresholds]) == expected
+    timed("days_above (numpy)", lambda: [index.days_above(x) for x in thresholds])
+    timed("days_above(chronological) (numpy)", lambda: [index.days_above(x, True) for x in thresholds])
+    timed("append x 10000 (numpy)", lambda: [index.append(t) for t in temps[:10_000]])
+
+
+if __name__ == "__main__":
+    temps = [28, 32, 31, 29, 35, 27, 30]
+    index = ThresholdIndex(temps)
+    print(index.count_above(30), list(index.values_above(30)))  # 3 [31.0, 32.0, 35.0]
+    print("Above 30°C on days:", [day + 1 for day in index.days_above(30, chronological=True)])  # [2, 3, 5]
+    index.append(33)
+    print(index.count_above(30), list(index.days_above(30, chronological=True)))  # 4 [1, 2, 4, 7]
+    bench_thresholds()
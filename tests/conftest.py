@@ -0,0 +1,8 @@
+# The packages live in src/ and are run from there (python -m ...); put it on sys.path so
+# the tests can import them the same way, whatever directory pytest is started from.
+import os
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,93 @@
+# has_capability / filter_capable must agree with isinstance for any class, not only for
+# those built on Capable: the classes of multiple_inheritance1.py, plain subclasses of a
+# mixin, classes created at runtime.
+import gc
+
+import pytest
+
+from python_notes_snippets.classes_examples import multiple_inheritance1
+from python_notes_snippets.classes_examples.capabilities import (
+    Capable,
+    Duck,
+    FlyableMixin,
+    SwimmableMixin,
+    WalkableMixin,
+    _MASKS,
+    capabilities_of,
+    declare_capability,
+    filter_capable,
+    has_capability,
+)
+
+
+class Jet(FlyableMixin):  # a plain subclass of a declared mixin
+    name = "jet"
+
+
+CAPABILITIES = (WalkableMixin, FlyableMixin, SwimmableMixin)
+OBJECTS = [
+    multiple_inheritance1.Bird("Robin"),
+    Duck("Donald"),
+    multiple_inheritance1.Snake("Nagini"),
+    Jet(),
+    multiple_inheritance1.Person(),  # mixins that aren't capabilities
+    42,
+]
+
+
+@pytest.mark.parametrize("obj", OBJECTS, ids=lambda obj: type(obj).__name__)
+@pytest.mark.parametrize("capability", CAPABILITIES, ids=lambda cls: cls.__name__)
+def test_has_capability_matches_isinstance(obj, capability):
+    assert has_capability(obj, capability) == isinstance(obj, capability)
+
+
+def test_several_capabilities():
+    bird, duck = OBJECTS[:2]
+    assert has_capability(duck, FlyableMixin, SwimmableMixin)
+    assert not has_capability(bird, FlyableMixin, SwimmableMixin)
+    assert capabilities_of(bird) == {WalkableMixin, FlyableMixin}
+    assert capabilities_of(Duck) == set(CAPABILITIES)
+
+
+@pytest.mark.parametrize("required", [(FlyableMixin,), (WalkableMixin, SwimmableMixin), CAPABILITIES])
+def test_filter_capable_matches_isinstance(required):
+    objs = OBJECTS * 3
+    expected = [obj for obj in objs if all(isinstance(obj, cls) for cls in required)]
+    assert filter_capable(objs, *required) == expected
+    assert filter_capable(iter(objs), *required) == expected
+
+
+def test_not_a_capability():
+    with pytest.raises(TypeError, match="not a capability"):
+        has_capability(OBJECTS[0], multiple_inheritance1.Animal)
+    with pytest.raises(TypeError, match="not a capability"):
+        filter_capable(OBJECTS, FlyableMixin, int)
+
+
+def test_capability_declared_after_a_check():
+    class Sings:
+        pass
+
+    class Canary(multiple_inheritance1.Bird, Sings):
+        pass
+
+    canary = Canary("Tweety")
+    assert has_capability(canary, FlyableMixin)  # Canary's mask is cached now
+    declare_capability(Sings)
+    assert has_capability(canary, Sings)
+
+    class Loud(Capable, capability=True):
+        pass
+
+    assert filter_capable([canary], Loud) == []
+
+
+def test_runtime_classes_are_freed():
+    gc.collect()
+    before = len(_MASKS)
+    for i in range(100):
+        cls = type(f"Flyer{i}", (FlyableMixin,), {})
+        assert has_capability(cls(), FlyableMixin)
+    del cls
+    gc.collect()
+    assert len(_MASKS) == before
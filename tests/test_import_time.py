@@ -0,0 +1,21 @@
+# Import-time budget: every module of algorithms / python_notes_snippets (bar
+# check_import_time.EXCLUDED) imports in a fresh interpreter within
+# check_import_time.BUDGET_MS, cumulative, on top of a bare interpreter's startup, and
+# prints nothing while doing it (see check_import_time.py).
+import pytest
+
+import check_import_time
+
+MODULES = list(check_import_time.iter_modules())
+
+
+@pytest.fixture(scope="module")
+def results():
+    # one sweep for all modules: check_all re-measures the slow ones after the others
+    return check_import_time.check_all(MODULES, check_import_time.startup_modules())
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_budget(results, module):
+    us, problem = results[module]
+    assert not problem, f"{module}: {problem}" + ("" if us is None else f" ({us / 1000:.1f} ms)")
@@ -0,0 +1,40 @@
+# write_index / PostingIndex round trip. Every file write_index produces must be readable:
+# in place (little-endian machines) or through the byteswapped copies a big-endian machine
+# falls back to; the copy path is forced here by clearing _IN_PLACE.
+import random
+
+import pytest
+
+from algorithms.arrays import posting_index
+from algorithms.arrays.posting_index import PostingIndex, write_index
+
+rng = random.Random(0)
+POSTINGS = {f"t{i}": rng.choices(range(2000), k=rng.randint(1, 600)) for i in range(20)}
+POSTINGS["héllo"] = [2**62, -5, 7]
+
+
+@pytest.fixture(params=[True, False], ids=["in place", "copied"])
+def index(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(posting_index, "_IN_PLACE", request.param)
+    path = tmp_path / "postings.idx"
+    write_index(path, POSTINGS, skip_interval=8)
+    with PostingIndex(path) as index:
+        yield index
+
+
+def test_round_trip(index):
+    assert list(index.terms()) == sorted(POSTINGS, key=lambda term: term.encode("utf-8"))
+    for term, ids in POSTINGS.items():
+        expected = sorted(set(ids))
+        assert list(index.postings(term)) == expected
+        assert list(index.skips(term)) == expected[::8]
+    assert "nope" not in index
+
+
+def test_intersect(index):
+    terms = sorted(POSTINGS)
+    for _ in range(50):
+        query = rng.sample(terms, rng.randint(1, 3))
+        expected = sorted(set.intersection(*(set(POSTINGS[term]) for term in query)))
+        assert index.intersect(*query) == expected
+    assert index.intersect("t0", "nope") == []
@@ -0,0 +1,175 @@
+# QueryServer / QueryClient end to end, over a Unix socket in a temporary directory: the
+# answers must match the plain algorithms they stand in for (intersect_three,
+# merge_arrays, isValidSubsequence2), and errors or misbehaving clients must fail their
+# own requests only, never hang the server.
+import asyncio
+import random
+import socket
+import struct
+
+import pytest
+
+from algorithms.arrays.merge_arrays_1 import merge_arrays
+from algorithms.arrays.merge_arrays_2 import intersect_three
+from algorithms.arrays.query_service import MERGE, QueryClient, QueryError, QueryServer
+from algorithms.arrays.valid_subsequence_a2 import isValidSubsequence2
+
+TIMEOUT = 10  # seconds; a hung server fails the test instead of the whole run
+
+rng = random.Random(0)
+LISTS = {f"L{i}": sorted(rng.choices(range(300), k=rng.randint(50, 200))) for i in range(4)}
+LISTS["empty"] = []
+
+
+def run(tmp_path, scenario, lists=LISTS, **options):
+    """Start a QueryServer on a socket under tmp_path and await scenario(server, path)."""
+    path = str(tmp_path / "query.sock")
+
+    async def main():
+        async with await QueryServer(lists, **options).start(path=path) as server:
+            return await asyncio.wait_for(scenario(server, path), TIMEOUT)
+
+    return asyncio.run(main())
+
+
+def test_answers_match_the_reference_algorithms(tmp_path):
+    names = sorted(LISTS)
+    triples = [(a, b, c) for a in names for b in names for c in names if a < b < c]
+    pairs = [(a, b) for a in names for b in names]
+    sequences = [(name, values[::k]) for name, values in LISTS.items() for k in (1, 3, 7)]
+    sequences += [(name, seq[::-1]) for name, seq in sequences if len(set(seq)) > 1]
+    sequences += [("L0", [-1]), ("empty", []), ("empty", [1])]
+
+    async def scenario(server, path):
+        async with await QueryClient.connect(path=path, pool_size=2) as client:
+            # all in flight at once, so they get batched and pipelined
+            return await asyncio.gather(
+                asyncio.gather(*(client.intersect(*triple) for triple in triples)),
+                asyncio.gather(*(client.merge(*pair) for pair in pairs)),
+                asyncio.gather(*(client.is_subsequence(name, seq) for name, seq in sequences)),
+            )
+
+    intersections, merges, subsequences = run(tmp_path, scenario)
+    for (a, b, c), got in zip(triples, intersections):
+        assert list(got) == intersect_three(LISTS[a], LISTS[b], LISTS[c])
+    for (a, b), got in zip(pairs, merges):
+        assert list(got) == merge_arrays(LISTS[a], LISTS[b])
+    for (name, seq), got in zip(sequences, subsequences):
+        assert got == isValidSubsequence2(LISTS[name], seq)
+
+
+def test_unknown_list(tmp_path):
+    async def scenario(server, path):
+        async with await QueryClient.connect(path=path, pool_size=1) as client:
+            with pytest.raises(QueryError, match="no list named 'nope'"):
+                await client.intersect("L0", "nope")
+            # an id the server never handed out
+            with pytest.raises(QueryError, match="unknown list id"):
+                await client._request(MERGE, [0, 99])
+            return list(await client.merge("L0"))
+
+    assert run(tmp_path, scenario) == LISTS["L0"]
+
+
+def test_failing_request_does_not_kill_the_batcher(tmp_path):
+    # 2**63 doesn't fit the int64 response: the merge fails, the server carries on
+    lists = {"big": [1, 2**63], "small": [0, 3]}
+
+    async def scenario(server, path):
+        async with await QueryClient.connect(path=path, pool_size=1) as client:
+            with pytest.raises(QueryError, match="OverflowError"):
+                await client.merge("big", "small")
+            return list(await client.merge("small"))
+
+    assert run(tmp_path, scenario, lists) == [0, 3]
+
+
+def test_dead_batcher_closes_every_connection(tmp_path):
+    def broken(op, ids, payload):
+        raise RuntimeError("batcher bug")
+
+    async def scenario(server, path):
+        server._answer = broken  # escapes the batcher, unlike anything _answer raises
+        async with await QueryClient.connect(path=path, pool_size=2) as client:
+            with pytest.raises(ConnectionError):
+                await asyncio.gather(client.merge("L0"), client.merge("L1"))
+
+    # and the server's close() reports what killed it
+    with pytest.raises(RuntimeError, match="batcher bug"):
+        run(tmp_path, scenario)
+
+
+def test_close_after_the_batcher_died(tmp_path):
+    path = str(tmp_path / "query.sock")
+
+    def broken(op, ids, payload):
+        raise RuntimeError("batcher bug")
+
+    async def main():
+        server = await QueryServer(LISTS).start(path=path)
+        # without the callback that drops connections when the batcher dies, close() is
+        # left to clean up a client that is still connected
+        server._batcher.remove_done_callback(server._batcher_done)
+        server._answer = broken
+        client = await QueryClient.connect(path=path, pool_size=1)
+        pending = asyncio.ensure_future(client.merge("L0"))
+        while not server._batcher.done():
+            await asyncio.sleep(0.01)
+        with pytest.raises(RuntimeError, match="batcher bug"):
+            await server.close()
+        assert all(writer.is_closing() for writer in server._writers)
+        assert not server._server.is_serving()
+        with pytest.raises(ConnectionError):
+            await pending
+        await client.close()
+
+    asyncio.run(asyncio.wait_for(main(), TIMEOUT))
+
+
+def test_dropped_client_connection(tmp_path):
+    async def scenario(server, path):
+        # a raw client sends a request and hangs up before its answer is written
+        reader, writer = await asyncio.open_unix_connection(path)
+        body = struct.pack("<IBH", 1, MERGE, 2) + struct.pack("<II", 0, 1)
+        writer.write(struct.pack("<I", len(body)) + body)
+        await writer.drain()
+        writer.transport.abort()
+        async with await QueryClient.connect(path=path, pool_size=1) as client:
+            return list(await client.merge("L0", "L1"))
+
+    assert run(tmp_path, scenario) == merge_arrays(LISTS["L0"], LISTS["L1"])
+
+
+def test_server_going_away_fails_pending_requests(tmp_path):
+    path = str(tmp_path / "query.sock")
+
+    async def main():
+        server = await QueryServer(LISTS).start(path=path)
+        client = await QueryClient.connect(path=path, pool_size=1)
+        await client.resolve("L0")
+        await server.close()
+        with pytest.raises(ConnectionError):
+            await client.merge("L0")
+        await client.close()
+
+    asyncio.run(asyncio.wait_for(main(), TIMEOUT))
+
+
+def test_slow_client_does_not_block_the_others(tmp_path):
+    lists = {"big": list(range(500_000)), "small": [1, 2, 3]}
+
+    async def scenario(server, path):
+        # a client that pipelines big merges and never reads the answers
+        slow = socket.socket(socket.AF_UNIX)
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow.connect(path)
+        body = struct.pack("<IBH", 1, MERGE, 1) + struct.pack("<I", 0)
+        slow.sendall((struct.pack("<I", len(body)) + body) * 20)
+        try:
+            async with await QueryClient.connect(path=path, pool_size=1) as client:
+                for _ in range(20):
+                    assert list(await client.merge("small")) == [1, 2, 3]
+        finally:
+            slow.close()
+
+    run(tmp_path, scenario, lists)